@@ -197,7 +197,14 @@ def scientificformat(value, fmt='%13.9E', sep=' ', sep2=':'):
     >>> scientificformat([[0.1, 0.2], [0.3, 0.4]], '%4.1E')
     '1.0E-01:2.0E-01 3.0E-01:4.0E-01'
     """
-    if isinstance(value, numpy.bool_):
+    if isinstance(value, (float, numpy.float32)):  # the common case first
+        fmt_value = fmt % value
+        # the set is built only for the (rare) negative values
+        if '-' in fmt_value and set(fmt_value) <= zeroset:
+            # '-0.0000000E+00' is converted into '0.0000000E+00
+            fmt_value = fmt_value.replace('-', '')
+        return fmt_value
+    elif isinstance(value, numpy.bool_):
         return '1' if value else '0'
     elif isinstance(value, bytes):
         return value.decode('utf8')
@@ -205,12 +212,6 @@ def scientificformat(value, fmt='%13.9E', sep=' ', sep2=':'):
         return value
     elif hasattr(value, '__len__'):
         return sep.join((scientificformat(f, fmt, sep2) for f in value))
-    elif isinstance(value, (float, numpy.float64, numpy.float32)):
-        fmt_value = fmt % value
-        if set(fmt_value) <= zeroset:
-            # '-0.0000000E+00' is converted into '0.0000000E+00
-            fmt_value = fmt_value.replace('-', '')
-        return fmt_value
     return str(value)
 
 
@@ -21,7 +21,6 @@ import time
 import pickle
 import getpass
 import operator
-import itertools
 from datetime import datetime
 from decorator import decorator
 import psutil
@@ -76,17 +75,14 @@ def performance_view(dstore):
     """
     pdata = dstore['performance_data']
     pdata.refresh()
-    data = sorted(pdata[()], key=operator.itemgetter(0))
-    out = []
-    for operation, group in itertools.groupby(data, operator.itemgetter(0)):
-        counts = 0
-        time = 0
-        mem = 0
-        for rec in group:
-            counts += rec['counts']
-            time += rec['time_sec']
-            mem = max(mem, rec['memory_mb'])
-        out.append((operation, time, mem, counts))
+    data = pdata[()]
+    # group by operation with a single sort in numpy
+    ops, inv = numpy.unique(data['operation'], return_inverse=True)
+    time = numpy.bincount(inv, data['time_sec'], len(ops))
+    mem = numpy.zeros(len(ops))
+    numpy.maximum.at(mem, inv, data['memory_mb'])
+    counts = numpy.bincount(inv, data['counts'], len(ops)).astype(int)
+    out = list(zip(ops, time, mem, counts))
     out.sort(key=operator.itemgetter(1), reverse=True)  # sort by time
     mems = dstore['task_info']['mem_gb']
     maxmem = ', maxmem=%.1f GB' % mems.max() if len(mems) else ''
@@ -33,7 +33,9 @@ def encode(val):
     :param: a unicode or bytes object
     :returns: bytes
     """
-    if isinstance(val, (list, tuple, numpy.ndarray)):
+    if type(val) is str:  # fast path for the most common case
+        return val.encode('utf-8')
+    elif isinstance(val, (list, tuple, numpy.ndarray)):
         # encode a sequence of strings
         return [encode(v) for v in val]
     elif isinstance(val, str):
@@ -50,7 +52,12 @@ def decode(val):
     :param: a unicode or bytes object
     :returns: a unicode object
     """
-    if isinstance(val, (list, tuple, numpy.ndarray)):
+    # fast paths for the most common cases
+    if type(val) is bytes:
+        return val.decode('utf-8')
+    elif type(val) is str:
+        return val
+    elif isinstance(val, (list, tuple, numpy.ndarray)):
         return [decode(v) for v in val]
     elif hasattr(val, 'decode'):
         # assume it is an encoded bytes object
@@ -98,6 +98,18 @@ def _header(fields, renamedict):
     return fields
 
 
+def _format_floats(array, fmt):
+    # vectorized version of scientificformat for a 1D or 2D array of floats,
+    # including the conversion of '-0.00000E+00' into '0.00000E+00'
+    if array.size == 0:  # numpy.char.mod would not return strings
+        return array.tolist()
+    strs = numpy.char.mod(fmt, array)
+    negzero = numpy.char.startswith(strs, '-') & (
+        numpy.char.strip(strs, '-+.0E') == '')
+    strs[negzero] = numpy.char.replace(strs[negzero], '-', '')
+    return strs.tolist()
+
+
 def write_csv(dest, data, sep=',', fmt='%.6E', header=(), comment=None,
               renamedict=None):
     """
@@ -144,18 +156,25 @@ def write_csv(dest, data, sep=',', fmt='%.6E', header=(), comment=None,
     def format(val):
         return scientificformat(val, fmt)
 
-    if autoheader:
-        all_fields = [col.split(':', 1)[0].split('~')
-                      for col in autoheader]
-        for record in data:
-            row = []
-            for fields in all_fields:
-                val = extract_from(record, fields)
-                if fields[0] in ('lon', 'lat', 'depth'):
-                    row.append('%.5f' % val)
-                else:
-                    row.append(format(val))
+    if autoheader and data.size == 0:
+        pass  # write only the header
+    elif autoheader:
+        # format the records column by column, vectorizing the scalar floats
+        columns = []
+        for col in autoheader:
+            fields = col.split(':', 1)[0].split('~')
+            values = extract_from(data, fields)
+            if fields[0] in ('lon', 'lat', 'depth'):
+                columns.append(numpy.char.mod('%.5f', values).tolist())
+            elif values.dtype.kind == 'f' and values.ndim == 1:
+                columns.append(_format_floats(values, fmt))
+            else:
+                columns.append([format(val) for val in values])
+        for row in zip(*columns):
             w.writerow(_header(row, renamedict))
+    elif (isinstance(data, numpy.ndarray) and data.dtype.kind == 'f'
+          and data.ndim == 2):
+        w.writerows(_format_floats(data, fmt))
     else:
         for row in data:
             w.writerow([format(col) for col in row])
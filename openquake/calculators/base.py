@@ -559,12 +559,12 @@ class HazardCalculator(BaseCalculator):
                 self.oqparam.concurrent_tasks = (
                     self.oqparam.__class__.concurrent_tasks.default)
             params = {name: value for name, value in
-                      vars(parent['oqparam']).items()
+                      vars(oqparent).items()
                       if name not in vars(self.oqparam)}
             self.save_params(**params)
             with self.monitor('importing inputs', measuremem=True):
                 self.read_inputs()
-            oqp = parent['oqparam']
+            oqp = oqparent
             if oqp.investigation_time != oq.investigation_time:
                 raise ValueError(
                     'The parent calculation was using investigation_time=%s'
@@ -1049,17 +1049,8 @@ def import_gmfs_csv(dstore, oqparam, sids):
     events['id'] = eids
     logging.info('Storing %d events, all relevant', E)
     dstore['events'] = events
-    # store the GMFs
-    dic = general.group_array(arr, 'sid')
-    offset = 0
-    gmvlst = []
-    for sid in sids:
-        n = len(dic.get(sid, []))
-        if n:
-            offset += n
-            gmvs = dic[sid]
-            gmvlst.append(gmvs)
-    data = numpy.concatenate(gmvlst)
+    # store the GMFs on the given sites, ordered by event ID
+    data = arr[numpy.isin(arr['sid'], sids)]
     data.sort(order='eid')
     create_gmf_data(dstore, oqparam.get_primary_imtls(),
                     oqparam.get_sec_imts(), data=data)
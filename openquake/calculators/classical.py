@@ -138,7 +138,7 @@ def postclassical(pgetter, N, hstats, individual_rlzs,
             if amplifier:
                 pc = amplifier.amplify(ampcode[sid], pc)
                 # NB: the pcurve have soil levels != IMT levels
-        if pc.array.sum() == 0:  # no data
+        if not pc.array.any():  # no data
             continue
         with compute_mon:
             if hstats:
@@ -31,6 +31,7 @@ from openquake.calculators import base
 
 U16 = numpy.uint16
 U32 = numpy.uint32
+F32 = numpy.float32
 
 
 # helper function to be used when saving the spectra as an array
@@ -132,7 +133,7 @@ class ConditionalSpectrumCalculator(base.HazardCalculator):
                 curve, oq.imtls[oq.imt_ref], oq.poes)  # there is 1 site
         self.P = P = len(self.imls)
         self.datastore.create_dset(
-            'cs-rlzs', float, (self.R, M, self.N, 2, self.P))
+            'cs-rlzs', F32, (self.R, M, self.N, 2, self.P))
         self.datastore.set_shape_descr(
             'cs-rlzs', rlz_id=self.R, period=self.periods,  sid=self.N,
             cs=2, poe_id=P)
@@ -140,8 +141,8 @@ class ConditionalSpectrumCalculator(base.HazardCalculator):
         self.datastore.set_shape_descr(
             'cs-stats', stat='mean', period=self.periods, sid=self.N,
             cs=['spec', 'std'], poe_id=P)
-        self.datastore.create_dset('_c', float, (_G, M, self.N, 2, P))
-        self.datastore.create_dset('_s', float, (_G, self.N, P))
+        self.datastore.create_dset('_c', F32, (_G, M, self.N, 2, P))
+        self.datastore.create_dset('_s', F32, (_G, self.N, P))
         G = max(len(rbg) for rbg in rlzs_by_gsim)
         maxw = 2 * 1024**3 / (16 * G * self.M)  # at max 2 GB
         maxweight = min(
@@ -294,7 +294,7 @@ class DisaggregationCalculator(base.HazardCalculator):
                       for sid in self.sitecol.sids]
         self.hmap4 = _hmap4(rlzs, oq.iml_disagg, oq.imtls,
                             self.poes_disagg, curves)
-        if self.hmap4.array.sum() == 0:
+        if not self.hmap4.array.any():
             raise SystemExit('Cannot do any disaggregation: zero hazard')
         self.datastore['hmap4'] = self.hmap4
         self.datastore['poe4'] = numpy.zeros_like(self.hmap4.array)
@@ -437,6 +437,7 @@ class DisaggregationCalculator(base.HazardCalculator):
         count = numpy.zeros(len(self.sitecol), U16)
         _disagg_trt = numpy.zeros(self.N, [(trt, float) for trt in self.trts])
         vcurves = []  # hazard curves with a vertical section for large poes
+        poe4 = numpy.zeros_like(self.hmap4.array)  # saved at the end
         for (s, m, k), mat6 in sorted(results.items()):
             # NB: k is an index with value 0 (MagDistEps) or 1 (MagLonLat)
             imt = self.imts[m]
@@ -447,7 +448,7 @@ class DisaggregationCalculator(base.HazardCalculator):
                 if k == 0 and m == 0 and poe == self.poes_disagg[-1]:
                     _disagg_trt[s] = tuple(pprod(mat5[..., 0], axis=(1, 2, 3)))
                 poe2 = pprod(mat5, axis=(0, 1, 2, 3))
-                self.datastore['poe4'][s, m, p] = poe2  # shape Z
+                poe4[s, m, p] = poe2  # shape Z
                 poe_agg = poe2.mean()
                 if (poe and abs(1 - poe_agg / poe) > .1 and not count[s]
                         and self.hmap4[s, m, p].any()):
@@ -457,7 +458,7 @@ class DisaggregationCalculator(base.HazardCalculator):
                         s, imt, poe_agg, poe)
                     vcurves.append(self.curves[s])
                     count[s] += 1
-                mat4 = agg_probs(*mat5)  # shape (Ma D E Z) or (Ma Lo La Z)
+                mat4 = pprod(mat5, axis=0)  # shape (Ma D E Z) or (Ma Lo La Z)
                 for key in oq.disagg_outputs:
                     if key == 'Mag' and k == 0:
                         out[key][s, m, p, :] = pprod(mat4, axis=(1, 2))
@@ -478,6 +479,7 @@ class DisaggregationCalculator(base.HazardCalculator):
                             1, 2, 0, 3)  # T Lo La Z -> Lo La T Z
                     # shape NMP..Z
         self.datastore['disagg'] = out
+        self.datastore['poe4'][:] = poe4
         # below a dataset useful for debugging, at minimum IMT and maximum RP
         self.datastore['_disagg_trt'] = _disagg_trt
         if len(vcurves):
@@ -490,7 +492,7 @@ class DisaggregationCalculator(base.HazardCalculator):
         for (s, z), r in numpy.ndenumerate(best_rlzs):
             lst = []
             for key in out:
-                if out[key][s, ..., z].sum() == 0:
+                if not out[key][s, ..., z].any():
                     lst.append(key)
             if lst:
                 logging.warning('No %s contributions for site=%d, rlz=%d',
@@ -37,7 +37,6 @@ from openquake.hazardlib.source.rupture import (
     RuptureProxy, EBRupture, get_ruptures)
 from openquake.commonlib import (
     calc, util, logs, readinput, logictree, datastore)
-from openquake.risklib.riskinput import str2rsi, rsi2str
 from openquake.calculators import base, views
 from openquake.calculators.getters import (
     get_rupture_getters, sig_eps_dt, time_dt)
@@ -50,6 +49,8 @@ U32 = numpy.uint32
 F32 = numpy.float32
 F64 = numpy.float64
 TWO32 = numpy.float64(2 ** 32)
+# maximum number of (rupture, site) pairs in the mean_stds computed at once
+MAX_BLOCK_SITES = 10_000
 
 
 # ######################## GMF calculator ############################ #
@@ -82,6 +83,28 @@ def strip_zeros(gmf_df):
     return gmf_df[ok]
 
 
+def _compute_block(block, cmaker, sig_eps, alldata, times, cmon):
+    # compute the means and stddevs of a block of ruptures with a
+    # single call to the GSIMs and then the GMFs rupture by rupture
+    t1 = time.time()
+    mean_stds = cmaker.get_mean_stds(
+        [computer.ctx for computer, _ in block])  # (4, G, M, N)
+    dt = (time.time() - t1) / len(block)  # mean_stds time per rupture
+    start = 0
+    for computer, fdt in block:
+        t1 = time.time()
+        stop = start + len(computer.ctx.sids)
+        data = computer.compute_all(sig_eps, mean_stds[..., start:stop])
+        start = stop
+        t2 = time.time()
+        cmon.duration += t2 - t1 + dt
+        cmon.counts += 1
+        times.append((computer.ebrupture.id, len(computer.ctx.sids),
+                      fdt + t2 - t1 + dt))
+        for key in data:
+            alldata[key].append(data[key])
+
+
 def event_based(proxies, full_lt, oqparam, dstore, monitor):
     """
     Compute GMFs and optionally hazard curves
@@ -90,7 +113,7 @@ def event_based(proxies, full_lt, oqparam, dstore, monitor):
     alldata = AccumDict(accum=[])
     sig_eps = []
     times = []  # rup_id, nsites, dt
-    hcurves = {}  # key -> poes
+    hcurves = {}  # (rlz, sid, imt) -> poes
     trt_smr = proxies[0]['trt_smr']
     fmon = monitor('filtering ruptures', measuremem=False)
     cmon = monitor('computing gmfs', measuremem=False)
@@ -103,44 +126,55 @@ def event_based(proxies, full_lt, oqparam, dstore, monitor):
         param['min_iml'] = oqparam.min_iml
         cmaker = ContextMaker(trt, rlzs_by_gsim, param)
         min_mag = getdefault(oqparam.minimum_magnitude, trt)
+        block = []  # pairs (computer, filtering time)
+        nsites = 0
         for proxy in proxies:
+            # NB: the monitors are updated by hand, since entering and
+            # exiting them for each rupture is a significant overhead
             t0 = time.time()
-            with fmon:
-                if proxy['mag'] < min_mag:
-                    continue
+            computer = None
+            if proxy['mag'] >= min_mag:
                 sids = srcfilter.close_sids(proxy, trt)
-                if len(sids) == 0:  # filtered away
-                    continue
-                proxy.geom = rupgeoms[proxy['geom_id']]
-                ebr = proxy.to_ebr(cmaker.trt)  # after the geometry is set
-                try:
-                    computer = GmfComputer(
-                        ebr, srcfilter.sitecol.filtered(sids), cmaker,
-                        oqparam.correl_model, oqparam.cross_correl,
-                        oqparam._amplifier, oqparam._sec_perils)
-                except FarAwayRupture:
-                    continue
-            with cmon:
-                data = computer.compute_all(sig_eps)
-            dt = time.time() - t0
-            times.append(
-                (computer.ebrupture.id, len(computer.ctx.sids), dt))
-            for key in data:
-                alldata[key].extend(data[key])
-    for key, val in sorted(alldata.items()):
+                if len(sids):
+                    proxy.geom = rupgeoms[proxy['geom_id']]
+                    ebr = proxy.to_ebr(cmaker.trt)  # after setting the geom
+                    try:
+                        computer = GmfComputer(
+                            ebr, srcfilter.sitecol.filtered(sids), cmaker,
+                            oqparam.correl_model, oqparam.cross_correl,
+                            oqparam._amplifier, oqparam._sec_perils)
+                    except FarAwayRupture:
+                        pass
+            t1 = time.time()
+            fmon.duration += t1 - t0
+            fmon.counts += 1
+            if computer is None:  # filtered away
+                continue
+            block.append((computer, t1 - t0))
+            nsites += len(computer.ctx.sids)
+            if nsites >= MAX_BLOCK_SITES:
+                _compute_block(block, cmaker, sig_eps, alldata, times, cmon)
+                block.clear()
+                nsites = 0
+        if block:
+            _compute_block(block, cmaker, sig_eps, alldata, times, cmon)
+    for key, arrays in alldata.items():
         if key in 'eid sid rlz':
-            alldata[key] = U32(alldata[key])
+            alldata[key] = U32(numpy.concatenate(arrays))
         else:
-            alldata[key] = F32(alldata[key])
+            alldata[key] = F32(numpy.concatenate(arrays))
     gmfdata = strip_zeros(pandas.DataFrame(alldata))
     if len(gmfdata) and oqparam.hazard_curves_from_gmfs:
         hc_mon = monitor('building hazard curves', measuremem=False)
+        # NB: oqparam.imtls builds a new DictArray at each access
+        imtls = oqparam.imtls
+        imts = list(imtls)
         for (sid, rlz), df in gmfdata.groupby(['sid', 'rlz']):
             with hc_mon:
                 poes = calc.gmvs_to_poes(
-                    df, oqparam.imtls, oqparam.ses_per_logic_tree_path)
-                for m, imt in enumerate(oqparam.imtls):
-                    hcurves[rsi2str(rlz, sid, imt)] = poes[m]
+                    df, imtls, oqparam.ses_per_logic_tree_path)
+                for m, imt in enumerate(imts):
+                    hcurves[rlz, sid, imt] = poes[m]
     times = numpy.array([tup + (monitor.task_no,) for tup in times], time_dt)
     times.sort(order='rup_id')
     if not oqparam.ground_motion_fields:
@@ -313,8 +347,7 @@ class EventBasedCalculator(base.HazardCalculator):
                 'The gmf_data table has more than %d rows' % TWO32)
         imtls = self.oqparam.imtls
         with agg_mon:
-            for key, poes in result.get('hcurves', {}).items():
-                r, sid, imt = str2rsi(key)
+            for (r, sid, imt), poes in result.get('hcurves', {}).items():
                 array = acc[r].setdefault(sid, 0).array[imtls(imt), 0]
                 array[:] = 1. - (1. - array) * (1. - poes)
         self.datastore.flush()
@@ -528,8 +561,10 @@ class EventBasedCalculator(base.HazardCalculator):
                     self.datastore['hcurves-rlzs'][:, r] = arr
                     if oq.poes:
                         hmap = calc.make_hmap(pmap, oq.imtls, oq.poes)
+                        harr = numpy.zeros((N, M, P), F32)
                         for sid in hmap:
-                            ds[sid, r] = hmap[sid].array
+                            harr[sid] = hmap[sid].array
+                        ds[:, r] = harr  # a single write per rlz
 
             if S:
                 logging.info('Computing statistical hazard curves')
@@ -554,8 +589,10 @@ class EventBasedCalculator(base.HazardCalculator):
                     self.datastore['hcurves-stats'][:, s] = arr
                     if oq.poes:
                         hmap = calc.make_hmap(pmap, oq.imtls, oq.poes)
+                        harr = numpy.zeros((N, M, P), F32)
                         for sid in hmap:
-                            ds[sid, s] = hmap[sid].array
+                            harr[sid] = hmap[sid].array
+                        ds[:, s] = harr  # a single write per stat
         if self.datastore.parent:
             self.datastore.parent.open('r')
         if oq.compare_with_classical:  # compute classical curves
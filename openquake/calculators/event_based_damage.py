@@ -191,7 +191,6 @@ class DamageCalculator(EventBasedRiskCalculator):
         self.datastore.swmr_on()
         smap = parallel.Starmap(
             event_based_damage, self.gen_args(eids), h5=self.datastore.hdf5)
-        smap.monitor.save('assets', self.assetcol.to_dframe())
         smap.monitor.save('crmodel', self.crmodel)
         return smap.reduce(self.combine)
 
@@ -220,7 +219,7 @@ class DamageCalculator(EventBasedRiskCalculator):
         """
         oq = self.oqparam
         # no damage check
-        if self.dmgcsq[:, :, :, 1:].sum() == 0:
+        if not self.dmgcsq[:, :, :, 1:].any():
             self.nodamage = True
             logging.warning(
                 'There is no damage, perhaps the hazard is too small?')
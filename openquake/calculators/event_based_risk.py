@@ -19,7 +19,6 @@
 import os.path
 import logging
 import operator
-import itertools
 import numpy
 import pandas
 from scipy import sparse
@@ -341,7 +340,6 @@ class EventBasedRiskCalculator(event_based.EventBasedCalculator):
             self.datastore.swmr_on()  # crucial!
             smap = parallel.Starmap(
                 event_based_risk, self.gen_args(eids), h5=self.datastore.hdf5)
-            smap.monitor.save('assets', self.assetcol.to_dframe())
             smap.monitor.save('crmodel', self.crmodel)
             smap.monitor.save('rlz_id', self.rlzs)
             smap.reduce(self.agg_dicts)
@@ -430,8 +428,9 @@ class EventBasedRiskCalculator(event_based.EventBasedCalculator):
         start = stop = weight = 0
         # IMPORTANT!! we rely on the fact that the hazard part
         # of the calculation stores the GMFs in chunks of constant eid
-        for eid, group in itertools.groupby(eids):
-            nsites = sum(1 for _ in group)
+        stops = numpy.append(numpy.flatnonzero(numpy.diff(eids)) + 1,
+                             len(eids))
+        for nsites in numpy.diff(stops, prepend=0).tolist():
             stop += nsites
             weight += nsites
             if weight > maxweight:
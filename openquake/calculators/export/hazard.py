@@ -123,22 +123,26 @@ def export_hcurves_by_imt_csv(
     custom = 'custom_site_id' in sitecol.array.dtype.names
     if custom:
         lst.insert(0, ('custom_site_id', 'S6'))
+    # fill the composite array column by column, without building a
+    # tuple per site
     hcurves = numpy.zeros(nsites, lst)
     if custom:
-        for sid, csi, lon, lat, dep in zip(
-                range(nsites), sitecol.custom_site_id,
-                sitecol.lons, sitecol.lats, sitecol.depths):
-            hcurves[sid] = (csi, lon, lat, dep) + tuple(array[sid, 0, :])
-    else:
-        hcurves = numpy.zeros(nsites, lst)
-        for sid, lon, lat, dep in zip(
-                range(nsites), sitecol.lons, sitecol.lats, sitecol.depths):
-            hcurves[sid] = (lon, lat, dep) + tuple(array[sid, 0, :])
+        hcurves['custom_site_id'] = sitecol.custom_site_id
+    hcurves['lon'] = sitecol.lons
+    hcurves['lat'] = sitecol.lats
+    hcurves['depth'] = sitecol.depths
+    for li, iml in enumerate(imls):
+        hcurves['poe-%.7f' % iml] = array[:nsites, 0, li]
     comment.update(imt=imt)
     return writers.write_csv(dest, hcurves, comment=comment,
                              header=[name for (name, dt) in lst])
 
 
+# output key -> prefix of the exported file name
+PREFIX = {'hcurves': 'hazard_curve', 'hmaps': 'hazard_map',
+          'uhs': 'hazard_uhs'}
+
+
 def hazard_curve_name(dstore, ekey, kind):
     """
     :param calc_id: the calculation ID
@@ -146,8 +150,7 @@ def hazard_curve_name(dstore, ekey, kind):
     :param kind: the kind of key
     """
     key, fmt = ekey
-    prefix = {'hcurves': 'hazard_curve', 'hmaps': 'hazard_map',
-              'uhs': 'hazard_uhs'}[key]
+    prefix = PREFIX[key]
     if kind.startswith('quantile-'):  # strip the 7 characters 'hazard_'
         fname = dstore.build_fname('quantile_' + prefix[7:], kind[9:], fmt)
     else:
@@ -220,6 +223,7 @@ def export_hcurves_csv(ekey, dstore):
 
 
 UHS = collections.namedtuple('UHS', 'imls location')
+STATISTICS = frozenset(['mean', 'max', 'std'])
 
 
 def get_metadata(realizations, kind):
@@ -239,12 +243,8 @@ def get_metadata(realizations, kind):
     elif kind.startswith('quantile-'):
         metadata['statistics'] = 'quantile'
         metadata['quantile_value'] = float(kind[9:])
-    elif kind == 'mean':
-        metadata['statistics'] = 'mean'
-    elif kind == 'max':
-        metadata['statistics'] = 'max'
-    elif kind == 'std':
-        metadata['statistics'] = 'std'
+    elif kind in STATISTICS:
+        metadata['statistics'] = kind
     return metadata
 
 
@@ -258,6 +258,7 @@ def export_uhs_xml(ekey, dstore):
     key, kind, fmt = get_kkf(ekey)
     fnames = []
     periods = [imt.period for imt in oq.imt_periods()]
+    locations = get_locations(sitemesh)
     for kind in oq.get_kinds(kind, R):
         metadata = get_metadata(rlzs, kind)
         uhs = extract(dstore, 'uhs?kind=' + kind)[kind]
@@ -266,22 +267,30 @@ def export_uhs_xml(ekey, dstore):
             writer = hazard_writers.UHSXMLWriter(
                 fname, periods=periods, poe=poe,
                 investigation_time=oq.investigation_time, **metadata)
-            data = []
-            for site, curve in zip(sitemesh, uhs):
-                data.append(UHS(curve[str(poe)], Location(site)))
+            data = [UHS(curve[str(poe)], loc)
+                    for loc, curve in zip(locations, uhs)]
             writer.serialize(data)
             fnames.append(fname)
     return sorted(fnames)
 
 
-class Location(object):
-    def __init__(self, xyz):
-        self.x, self.y = tuple(xyz)[:2]
-        self.wkt = 'POINT(%s %s)' % (self.x, self.y)
+class Location(collections.namedtuple('Location', 'x y')):
+    __slots__ = ()  # no per-instance __dict__
+
+    @property
+    def wkt(self):
+        # built on demand, the writers only need x and y
+        return 'POINT(%s %s)' % (self.x, self.y)
+
+
+def get_locations(sitemesh):
+    """
+    :returns: a list of Location objects, built once per export
+    """
+    return list(map(Location, sitemesh['lon'], sitemesh['lat']))
 
 
 HazardCurve = collections.namedtuple('HazardCurve', 'location poes')
-HazardMap = collections.namedtuple('HazardMap', 'lon lat iml')
 
 
 @export.add(('hcurves', 'xml'))
@@ -290,7 +299,7 @@ def export_hcurves_xml(ekey, dstore):
     key, kind, fmt = get_kkf(ekey)
     len_ext = len(fmt) + 1
     oq = dstore['oqparam']
-    sitemesh = get_sites(dstore['sitecol'])
+    locations = get_locations(get_sites(dstore['sitecol']))
     rlzs = dstore['full_lt'].get_realizations()
     R = len(rlzs)
     fnames = []
@@ -304,17 +313,17 @@ def export_hcurves_xml(ekey, dstore):
             smlt_path = ''
             gsimlt_path = ''
         name = hazard_curve_name(dstore, ekey, kind)
-        for im in oq.imtls:
-            key = 'hcurves?kind=%s&imt=%s' % (kind, im)
-            hcurves = extract(dstore, key)[kind]  # shape (N, 1, L1)
+        # read the curves for all the IMTs at once
+        hcurves = extract(dstore, 'hcurves?kind=' + kind)[kind]  # (N, M, L1)
+        for m, (im, imls) in enumerate(oq.imtls.items()):
             imt = from_string(im)
             fname = name[:-len_ext] + '-' + im + '.' + fmt
-            data = [HazardCurve(Location(site), poes[0])
-                    for site, poes in zip(sitemesh, hcurves)]
+            data = [HazardCurve(loc, poes)
+                    for loc, poes in zip(locations, hcurves[:, m])]
             imt_name = 'SA' if im.startswith('SA') else im
             writer = writercls(fname,
                                investigation_time=oq.investigation_time,
-                               imls=oq.imtls[im], imt=imt_name,
+                               imls=imls, imt=imt_name,
                                sa_period=getattr(imt, 'period', None) or None,
                                sa_damping=getattr(imt, 'damping', None),
                                smlt_path=smlt_path, gsimlt_path=gsimlt_path)
@@ -348,8 +357,8 @@ def export_hmaps_xml(ekey, dstore):
             for p, poe in enumerate(oq.poes):
                 suffix = '-%s-%s' % (poe, imt)
                 fname = hazard_curve_name(dstore, ekey, kind + suffix)
-                data = [HazardMap(site[0], site[1], hmap[m, p])
-                        for site, hmap in zip(sitemesh, hmaps)]
+                # the writer only needs (lon, lat, iml) triples
+                data = zip(sitemesh['lon'], sitemesh['lat'], hmaps[:, m, p])
                 writer = writercls(
                     fname, investigation_time=oq.investigation_time,
                     imt=imt, poe=poe,
@@ -550,8 +559,9 @@ def export_disagg_csv(ekey, dstore):
                     nonzeros.append(True)
                 else:
                     nonzeros.append(poes.any())  # nonzero poes
-                for row in aw:
-                    values.append([imt, poes_disagg[p]] + list(row))
+                # convert the whole array at once, not row by row
+                for row in aw.array.tolist():
+                    values.append([imt, poes_disagg[p], *row])
             if any(nonzeros):
                 com = {key: value for key, value in metadata.items()
                        if value is not None and key not in skip_keys}
@@ -15,6 +15,8 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with OpenQuake.  If not, see <http://www.gnu.org/licenses/>.
+import numpy
+import pandas
 from openquake.baselib.python3compat import decode
 from openquake.baselib import writers
 from openquake.calculators.post_risk import get_loss_builder
@@ -87,41 +89,43 @@ class LossCurveExporter(object):
         :param asset_refs: names of the asset
         :param curves_dict: a dictionary tag -> loss curves
         """
-        aval = self.assetcol.arr_value(self.loss_types)
+        arefs = numpy.array(asset_refs)
+        order = numpy.argsort(arefs, kind='stable')  # sort by asset_id
+        arefs = arefs[order]
+        A = len(arefs)
+        aval = self.assetcol.arr_value(self.loss_types)[order]
         writer = writers.CsvWriter(fmt=writers.FIVEDIGITS)
         ebr = hasattr(self, 'builder')
         for key in sorted(curves_dict):
-            recs = curves_dict[key]
-            if ebr:
-                data = [['asset_id', 'loss_type', 'loss_value', 'loss_ratio',
-                         'return_period', 'annual_frequency_of_exceedence']]
-            else:
-                data = [['asset_id', 'loss_type', 'loss_value', 'loss_ratio',
-                         'poe']]
+            recs = curves_dict[key][order]
+            dfs = []
             for li, lt in enumerate(self.loss_types):
                 if ebr:  # event_based_risk
-                    array = recs[:, :, li]  # shape (A, P, LI)
-                    periods = self.builder.return_periods
-                    for aref, losses, val in sorted(zip(
-                            asset_refs, array, aval[:, li])):
-                        for period, loss in zip(periods, losses):
-                            data.append((aref, lt, loss, loss/val,
-                                         period, 1. / period))
+                    losses = recs[:, :, li]  # shape (A, P)
+                    periods = numpy.tile(self.builder.return_periods, A)
                 else:  # classical_risk
-                    array = recs[lt]  # shape (A,) loss_curve_dt
-                    for aref, losses, poes, val in sorted(zip(
-                            asset_refs, array['losses'],
-                            array['poes'], aval[:, li])):
-                        for loss, poe in zip(losses, poes):
-                            data.append((aref, lt, loss, loss/val, poe))
+                    losses = recs[lt]['losses']  # shape (A, C)
+                    poes = recs[lt]['poes'].flatten()
+                C = losses.shape[1]
+                dic = dict(asset_id=numpy.repeat(arefs, C), loss_type=lt,
+                           loss_value=losses.flatten(),
+                           loss_ratio=(losses / aval[:, [li]]).flatten())
+                if ebr:
+                    dic['return_period'] = periods
+                    dic['annual_frequency_of_exceedence'] = 1. / periods
+                else:
+                    dic['poe'] = poes
+                dfs.append(pandas.DataFrame(dic))
             dest = self.dstore.build_fname(
                 'loss_curves', '%s-%s' % (spec, key) if spec else key, 'csv')
             com = dict(
                 kind=key,
                 risk_investigation_time=self.oq.risk_investigation_time
                 or self.oq.investigation_time)
-            writer.save(data, dest, comment=com,
-                        renamedict=dict(id='asset_id'))
+            # saved as a composite array, so that the floats are formatted
+            # by write_csv as before (NAN, no negative zeros)
+            df = pandas.concat(dfs, ignore_index=True)
+            writer.save(df.to_records(index=False), dest, comment=com)
         return writer.getsaved()
 
     def export(self, export_type, what):
@@ -328,18 +328,19 @@ def export_damages_csv(ekey, dstore):
     name = ekey[0].split('-')[0]
     if oq.calculation_mode != 'classical_damage':
         name = 'avg_' + name
+    if ebd:  # the rate and the consequence dtype are read only once
+        rate = len(dstore['events']) * oq.time_ratio / len(rlzs)
+        csq_dt = build_csq_dt(dstore)
     for i, ros in enumerate(rlzs_or_stats):
         if ebd:  # export only the consequences from damages-rlzs, i == 0
-            rate = len(dstore['events']) * oq.time_ratio / len(rlzs)
             data = orig[:, i] * rate
             A, L, Dc = data.shape
             if Dc == D:  # no consequences, export nothing
                 return
-            csq_dt = build_csq_dt(dstore)
             damages = numpy.zeros(A, csq_dt)
-            for a in range(A):
-                for li, lt in enumerate(csq_dt.names):
-                    damages[lt][a] = tuple(data[a, li, D:Dc])
+            for li, lt in enumerate(csq_dt.names):
+                for ci, csq in enumerate(csq_dt[lt].names):
+                    damages[lt][csq] = data[:, li, D + ci]
             fname = dstore.build_fname('avg_risk', ros, ekey[1])
         else:  # scenario_damage, classical_damage
             if oq.modal_damage_state:
@@ -353,10 +354,13 @@ def export_damages_csv(ekey, dstore):
 
 
 # emulate a Django point
-class Location(object):
-    def __init__(self, x, y):
-        self.x, self.y = x, y
-        self.wkt = 'POINT(%s %s)' % (x, y)
+class Location(collections.namedtuple('Location', 'x y')):
+    __slots__ = ()
+
+    @property
+    def wkt(self):
+        # built on demand, the writers only need x and y
+        return 'POINT(%s %s)' % (self.x, self.y)
 
 
 def indices(*sizes):
@@ -25,12 +25,10 @@ import gzip
 import ast
 import io
 
-import requests
 from h5py._hl.dataset import Dataset
 from h5py._hl.group import Group
 import numpy
 import pandas
-from scipy.cluster.vq import kmeans2
 
 from openquake.baselib import config, hdf5, general, writers
 from openquake.baselib.hdf5 import ArrayWrapper
@@ -1279,16 +1277,20 @@ def extract_rupture_info(dstore, what):
               ('strike', F32), ('dip', F32), ('rake', F32)]
     rows = []
     boundaries = []
+    rupgeoms = dstore['rupgeoms']
     for rgetter in getters.get_rupture_getters(dstore):
-        proxies = rgetter.get_proxies(min_mag)
+        proxies = rgetter.get_proxies(min_mag, rupgeoms)
         rup_data = RuptureData(rgetter.trt, rgetter.rlzs_by_gsim)
         for r in rup_data.to_array(proxies):
-            coords = ['%.5f %.5f' % xyz[:2] for xyz in zip(*r['boundaries'])]
-            coordset = sorted(set(coords))
+            # format all the points with a single % operation
+            lons, lats = r['boundaries'][:2]
+            lonlats = numpy.column_stack([lons, lats]).ravel()
+            coords = ', '.join(['%.5f %.5f'] * len(lons)) % tuple(lonlats)
+            coordset = sorted(set(coords.split(', ')))
             if len(coordset) < 4:   # degenerate to line
                 boundaries.append('LINESTRING(%s)' % ', '.join(coordset))
             else:  # good polygon
-                boundaries.append('POLYGON((%s))' % ', '.join(coords))
+                boundaries.append('POLYGON((%s))' % coords)
             rows.append(
                 (r['rup_id'], r['multiplicity'], r['mag'],
                  r['lon'], r['lat'], r['depth'],
@@ -1314,9 +1316,10 @@ def extract_ruptures(dstore, what):
     bio = io.StringIO()
     first = True
     trts = list(dstore.getitem('full_lt').attrs['trts'])
+    rupgeoms = dstore['rupgeoms']
     for rgetter in getters.get_rupture_getters(dstore):
         rups = [rupture._get_rupture(proxy.rec, proxy.geom, rgetter.trt)
-                for proxy in rgetter.get_proxies(min_mag)]
+                for proxy in rgetter.get_proxies(min_mag, rupgeoms)]
         arr = rupture.to_csv_array(rups)
         if first:
             header = None
@@ -1407,6 +1410,7 @@ class WebExtractor(Extractor):
             username = config.webapi.username
         if password is None:
             password = config.webapi.password
+        import requests  # slow to import, needed only here
         self.sess = requests.Session()
         if username:
             login_url = '%s/accounts/ajax_login/' % self.server
@@ -1474,6 +1478,7 @@ def clusterize(hmaps, rlzs, k):
     :param k: number of clusters to build
     :returns: (array(K, MP), labels(R))
     """
+    from scipy.cluster.vq import kmeans2
     R, M, P = hmaps.shape
     hmaps = hmaps.transpose(0, 2, 1).reshape(R, M * P)
     dt = [('label', U32), ('branch_paths', object), ('centroid', (F32, M*P))]
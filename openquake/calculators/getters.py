@@ -289,14 +289,17 @@ def get_ebruptures(dstore):
     Extract EBRuptures from the datastore
     """
     ebrs = []
+    rupgeoms = dstore['rupgeoms']  # read from the already opened datastore
     for rgetter in get_rupture_getters(dstore):
-        for proxy in rgetter.get_proxies():
+        for proxy in rgetter.get_proxies(rupgeoms=rupgeoms):
             ebrs.append(proxy.to_ebr(rgetter.trt))
     return ebrs
 
 
 def line(points):
-    return '(%s)' % ', '.join('%.5f %.5f %.5f' % tuple(p) for p in points)
+    # points is an array of shape (C, 3), formatted with a single %
+    fmt = ', '.join(['%.5f %.5f %.5f'] * len(points))
+    return '(%s)' % (fmt % tuple(points.flat))
 
 
 def multiline(array3RC):
@@ -363,18 +366,21 @@ class RuptureGetter(object):
             dic['srcid'] = rec['source_id']
         return dic
 
-    def get_proxies(self, min_mag=0):
+    def get_proxies(self, min_mag=0, rupgeoms=None):
         """
+        :param min_mag: discard the ruptures below this magnitude
+        :param rupgeoms: the rupgeoms dataset, if already opened by the caller
         :returns: a list of RuptureProxies
         """
+        if rupgeoms is None:
+            with datastore.read(self.filename) as dstore:
+                return self.get_proxies(min_mag, dstore['rupgeoms'])
         proxies = []
-        with datastore.read(self.filename) as dstore:
-            rupgeoms = dstore['rupgeoms']
-            for proxy in self.proxies:
-                if proxy['mag'] < min_mag:
-                    continue
-                proxy.geom = rupgeoms[proxy['geom_id']]
-                proxies.append(proxy)
+        for proxy in self.proxies:
+            if proxy['mag'] < min_mag:
+                continue
+            proxy.geom = rupgeoms[proxy['geom_id']]
+            proxies.append(proxy)
         return proxies
 
     # called in ebrisk calculations
@@ -382,11 +388,9 @@ class RuptureGetter(object):
         """
         :returns: RuptureProxies with weight < maxw
         """
-        proxies = []
-        for proxy in self.proxies:
-            sids = srcfilter.close_sids(proxy.rec, self.trt)
-            if len(sids):
-                proxies.append(proxy)
+        recs = numpy.array([proxy.rec for proxy in self.proxies])
+        nsites = srcfilter.count_close_sites(recs, self.trt)
+        proxies = [proxy for proxy, n in zip(self.proxies, nsites) if n]
         rgetters = []
         for block in general.block_splitter(proxies, maxw, weight):
             rg = RuptureGetter(block, self.filename, self.trt_smr, self.trt,
@@ -184,7 +184,7 @@ class MultiRiskCalculator(base.RiskCalculator):
             else:
                 peril = csv2peril(fname, name, self.sitecol, tofloat,
                                   oq.asset_hazard_distance)
-            if peril.sum() == 0:
+            if not peril.any():
                 logging.warning('No sites were affected by %s' % name)
             self.datastore['multi_peril'][name] = peril
 
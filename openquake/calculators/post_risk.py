@@ -122,11 +122,12 @@ def get_src_loss_table(dstore, L):
     rup_ids = evs['rup_id']
     source_id = python3compat.decode(dstore['ruptures']['source_id'][rup_ids])
     w = dstore['weights'][:]
-    acc = general.AccumDict(accum=numpy.zeros(L, F32))
-    for source_id, rlz_id, loss_id, loss in zip(
-            source_id, rlz_ids, alt.loss_id.to_numpy(), alt.loss.to_numpy()):
-        acc[source_id][loss_id] += loss * w[rlz_id]
-    return zip(*sorted(acc.items()))
+    # accumulate all the rows in a single pass, grouped by source
+    srcs, idxs = numpy.unique(source_id, return_inverse=True)
+    losses = numpy.zeros((len(srcs), L), F32)
+    numpy.add.at(losses, (idxs, alt.loss_id.to_numpy()),
+                 alt.loss.to_numpy() * w[rlz_ids])
+    return list(srcs), losses
 
 
 def fix_dtype(dic, dtype, names):
@@ -185,24 +186,23 @@ def store_agg(dstore, rbe_df, num_events):
     else:
         rbe_df['rlz_id'] = 0
     del rbe_df['event_id']
-    aggrisk = general.AccumDict(accum=[])
     columns = [col for col in rbe_df.columns if col not in {
         'event_id', 'agg_id', 'rlz_id', 'loss_id', 'variance'}]
     dmgs = [col for col in columns if col.startswith('dmg_')]
+    gb = rbe_df.groupby(['agg_id', 'rlz_id', 'loss_id'])
+    # a single (groups, columns) matrix of sums, one row per group
+    sums = gb[columns].sum()
+    agg_id, rlz_id, loss_id = (
+        sums.index.get_level_values(i).to_numpy() for i in range(3))
+    ne = num_events[rlz_id]
+    aggrisk = dict(agg_id=agg_id, rlz_id=rlz_id, loss_id=loss_id)
     if dmgs:
+        # infer the number of buildings in nodamage state
         aggnumber = dstore['agg_values']['number']
-    gb = rbe_df.groupby(['agg_id', 'rlz_id', 'loss_id'])
-    for (agg_id, rlz_id, loss_id), df in gb:
-        ne = num_events[rlz_id]
-        aggrisk['agg_id'].append(agg_id)
-        aggrisk['rlz_id'].append(rlz_id)
-        aggrisk['loss_id'].append(loss_id)
-        if dmgs:
-            # infer the number of buildings in nodamage state
-            ndamaged = sum(df[col].sum() for col in dmgs)
-            aggrisk['dmg_0'].append(aggnumber[agg_id] - ndamaged / ne)
-        for col in columns:
-            aggrisk[col].append(df[col].sum() / ne)
+        ndamaged = sums[dmgs].to_numpy().sum(axis=1)
+        aggrisk['dmg_0'] = aggnumber[agg_id] - ndamaged / ne
+    for col in columns:
+        aggrisk[col] = sums[col].to_numpy() / ne
     fix_dtypes(aggrisk)
     aggrisk = pandas.DataFrame(aggrisk)
     dstore.create_df(
@@ -29,7 +29,7 @@ import pandas
 
 from openquake.baselib.general import (
     humansize, countby, AccumDict, CallableDict,
-    get_array, group_array, fast_agg)
+    get_array, group_array, fast_agg, fast_agg2)
 from openquake.baselib.hdf5 import FLOAT, INT, get_shape_descr
 from openquake.baselib.performance import performance_view
 from openquake.baselib.python3compat import encode, decode
@@ -185,8 +185,7 @@ def view_slow_ruptures(token, dstore, maxrows=25):
     """
     Show the slowest ruptures
     """
-    fields = ['code', 'n_occ', 'mag', 'trt_smr']
-    rups = dstore['ruptures'][()][fields]
+    rups = dstore['ruptures']['code', 'n_occ', 'mag', 'trt_smr']
     time = dstore['gmf_data/time_by_rup'][()]
     arr = util.compose_arrays(rups, time)
     arr = arr[arr['nsites'] > 0]
@@ -483,7 +482,7 @@ def view_exposure_info(token, dstore):
     Display info about the exposure model
     """
     assetcol = dstore['assetcol/array'][:]
-    taxonomies = sorted(set(dstore['assetcol'].taxonomies))
+    taxonomies = numpy.unique(assetcol['taxonomy'])
     data = [('#assets', len(assetcol)),
             ('#taxonomies', len(taxonomies))]
     return text_table(data) + '\n\n' + view_assets_by_site(token, dstore)
@@ -904,12 +903,11 @@ def view_events_by_mag(token, dstore):
     """
     Show how many events there are for each magnitude
     """
-    rups = dstore['ruptures'][()]
+    rups = dstore['ruptures']['id', 'mag']
     num_evs = fast_agg(dstore['events']['rup_id'])
-    counts = {}
-    for mag, grp in group_array(rups, 'mag').items():
-        counts[mag] = sum(num_evs[rup_id] for rup_id in grp['id'])
-    return numpy.array(list(counts.items()), dt('mag num_events'))
+    # join the events with the ruptures and sum by magnitude in numpy
+    mags, counts = fast_agg2(rups['mag'], num_evs[rups['id']])
+    return numpy.array(list(zip(mags, counts)), dt('mag num_events'))
 
 
 @view.add('ebrups_by_mag')
@@ -1219,6 +1217,6 @@ def view_rup_stats(token, dstore):
     """
     Show the statistics of event based ruptures
     """
-    rups = dstore['ruptures'][:]
+    rups = dstore['ruptures']['mag', 'n_occ']
     out = [stats(f, rups[f]) for f in 'mag n_occ'.split()]
     return numpy.array(out, dt('kind counts mean stddev min max'))
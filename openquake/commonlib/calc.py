@@ -64,13 +64,12 @@ def convert_to_array(pmap, nsites, imtls, inner_idx=0):
         for iml in imls:
             lst.append(('%s-%.3f' % (imt, iml), F32))
     curves = numpy.zeros(nsites, numpy.dtype(lst))
+    # the field names are built once, not once per site
+    names = [name for name, _ in lst]
     for sid, pcurve in pmap.items():
         curve = curves[sid]
-        idx = 0
-        for imt, imls in imtls.items():
-            for iml in imls:
-                curve['%s-%.3f' % (imt, iml)] = pcurve.array[idx, inner_idx]
-                idx += 1
+        for idx, name in enumerate(names):
+            curve[name] = pcurve.array[idx, inner_idx]
     return curves
 
 
@@ -247,11 +246,12 @@ class RuptureImporter(object):
         :returns: a composite array with the associations eid->rlz
         """
         eid_rlz = []
+        scenario = 'scenario' in self.oqparam.calculation_mode
         for rup in proxies:
             ebr = EBRupture(
                 Mock(rup_id=rup['seed']), rup['source_id'],
                 rup['trt_smr'], rup['n_occ'], e0=rup['e0'],
-                scenario='scenario' in self.oqparam.calculation_mode)
+                scenario=scenario)
             for rlz_id, eids in ebr.get_eids_by_rlz(rlzs_by_gsim).items():
                 for eid in eids:
                     eid_rlz.append((eid, rup['id'], rlz_id))
@@ -302,11 +302,12 @@ class RuptureImporter(object):
                 self.get_eid_rlz, iterargs, progress=logging.debug)
         i = 0
         for eid_rlz in it:
-            for er in eid_rlz:
-                events[i] = er
-                i += 1
-                if i >= TWO32:
-                    raise ValueError('There are more than %d events!' % i)
+            # copy the whole block of events at once
+            n = len(eid_rlz)
+            if i + n >= TWO32:
+                raise ValueError('There are more than %d events!' % (i + n))
+            events[i:i + n] = eid_rlz
+            i += n
         events.sort(order='rup_id')  # fast too
         # sanity check
         n_unique_events = len(numpy.unique(events[['id', 'rup_id']]))
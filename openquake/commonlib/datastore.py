@@ -19,6 +19,7 @@
 import io
 import os
 import re
+import copy
 import gzip
 import collections
 import numpy
@@ -467,6 +468,17 @@ class DataStore(collections.abc.MutableMapping):
     def __getitem__(self, key):
         if self.hdf5 == ():  # the datastore is closed
             raise ValueError('Cannot find %s in %s' % (key, self))
+        if key == 'oqparam':
+            # the parameters are read all the time and they do not change
+            # unless they are saved again, so they are deserialized once;
+            # a deep copy is returned since the callers can change attributes,
+            # including mutable ones like inputs and hazard_imtls
+            if '_oqparam' not in vars(self):
+                self._oqparam = self._getitem(key)
+            return copy.deepcopy(self._oqparam)
+        return self._getitem(key)
+
+    def _getitem(self, key):
         try:
             val = self.hdf5[key]
         except KeyError:
@@ -482,6 +494,8 @@ class DataStore(collections.abc.MutableMapping):
         return val
 
     def __setitem__(self, key, val):
+        if key == 'oqparam':
+            vars(self).pop('_oqparam', None)
         if key in self.hdf5:
             # there is a bug in the current version of HDF5 for composite
             # arrays: is impossible to save twice the same key; so we remove
@@ -494,6 +508,8 @@ class DataStore(collections.abc.MutableMapping):
                                (key, exc, self.filename))
 
     def __delitem__(self, key):
+        if key == 'oqparam':
+            vars(self).pop('_oqparam', None)
         del self.hdf5[key]
 
     def __enter__(self):
@@ -20,12 +20,13 @@
 Classes for serializing various NRML XML artifacts.
 """
 import operator
+import itertools
 
 import numpy
 
 from xml.etree import ElementTree as et
 
-from openquake.baselib.node import Node, scientificformat, floatformat
+from openquake.baselib.node import Node, floatformat
 from openquake.hazardlib import nrml
 
 by_imt = operator.itemgetter('imt', 'sa_period', 'sa_damping')
@@ -50,6 +51,21 @@ _ATTR_MAP = dict([
 
 GML_NS = nrml.SERIALIZE_NS_MAP['gml']
 
+#: Default format of the floats in the hazard curves
+FMT = '%13.9E'
+
+
+def _fmt(values, fmt=FMT):
+    """
+    Format a sequence of floats by using numpy.char.mod, which is much
+    faster than calling scientificformat on each value. Negative zeros
+    are converted into positive zeros, as in scientificformat.
+
+    >>> _fmt([0.1, -0., 2E-5])
+    '1.000000000E-01 0.000000000E+00 2.000000000E-05'
+    """
+    return ' '.join(numpy.char.mod(fmt, numpy.asarray(values, float) + 0.))
+
 
 def _validate_hazard_metadata(md):
     """
@@ -187,32 +203,32 @@ class HazardCurveXMLWriter(BaseCurveWriter):
               have `x` and `y` to represent lon and lat, respectively.
         """
         with open(self.dest, 'wb') as fh:
-            root = et.Element('nrml')
-            self.add_hazard_curves(root, self.metadata, data)
-            nrml.write(list(root), fh)
+            nrml.write([self.hazard_curves_node(self.metadata, data)], fh)
 
-    def add_hazard_curves(self, root, metadata, data):
+    def hazard_curves_node(self, metadata, data):
         """
-        Add hazard curves stored into `data` as child of the `root`
-        element with `metadata`. See the documentation of the method
-        `serialize` and the constructor for a description of `data`
-        and `metadata`, respectively.
+        Build a `hazardCurves` node with the given `metadata`; the curves
+        stored into `data` are converted into nodes lazily, so that they
+        are serialized one at the time without keeping the whole XML tree
+        in memory. See the documentation of the method `serialize` and the
+        constructor for a description of `data` and `metadata`,
+        respectively.
         """
-        hazard_curves = et.SubElement(root, 'hazardCurves')
-
-        _set_metadata(hazard_curves, metadata, _ATTR_MAP)
-
-        imls_elem = et.SubElement(hazard_curves, 'IMLs')
-        imls_elem.text = ' '.join(map(scientificformat, metadata['imls']))
-        gml_ns = nrml.SERIALIZE_NS_MAP['gml']
-
-        for hc in data:
-            hc_elem = et.SubElement(hazard_curves, 'hazardCurve')
-            gml_point = et.SubElement(hc_elem, '{%s}Point' % gml_ns)
-            gml_pos = et.SubElement(gml_point, '{%s}pos' % gml_ns)
-            gml_pos.text = '%s %s' % (hc.location.x, hc.location.y)
-            poes_elem = et.SubElement(hc_elem, 'poEs')
-            poes_elem.text = ' '.join(map(scientificformat, hc.poes))
+        hazard_curves = Node('hazardCurves', {
+            attr: str(metadata[kw]) for kw, attr in _ATTR_MAP.items()
+            if metadata.get(kw) is not None})
+        # NB: the format is explicit since nrml.write changes the default
+        imls = Node('IMLs', text=_fmt(metadata['imls']))
+        hazard_curves.nodes = itertools.chain(
+            [imls], (self._curve_node(hc) for hc in data))
+        return hazard_curves
+
+    def _curve_node(self, hc):
+        point = Node('{%s}Point' % GML_NS, nodes=[
+            Node('{%s}pos' % GML_NS,
+                 text='%s %s' % (hc.location.x, hc.location.y))])
+        poes = Node('poEs', text=_fmt(hc.poes))
+        return Node('hazardCurve', nodes=[point, poes])
 
 
 def gen_gmfs(gmf_set):
@@ -489,6 +505,8 @@ class UHSXMLWriter(BaseCurveWriter):
                 gml_pos = et.SubElement(gml_point, '{%s}pos' % gml_ns)
                 gml_pos.text = '%s %s' % (uhs.location.x, uhs.location.y)
                 imls_elem = et.SubElement(uhs_elem, 'IMLs')
-                imls_elem.text = ' '.join(['%10.7E' % x for x in uhs.imls])
+                # NB: unlike _fmt, negative zeros are kept as they are
+                imls_elem.text = ' '.join(numpy.char.mod(
+                    '%10.7E', numpy.asarray(uhs.imls, float)))
 
             nrml.write(list(root), fh)
@@ -23,6 +23,7 @@ import re
 import socket
 import getpass
 import logging
+import functools
 import traceback
 from datetime import datetime
 from openquake.baselib import config, zeromq, parallel
@@ -36,6 +37,10 @@ LEVELS = {'debug': logging.DEBUG,
 CALC_REGEX = r'(calc|cache)_(\d+)\.hdf5'
 DBSERVER_PORT = int(os.environ.get('OQ_DBSERVER_PORT') or config.dbserver.port)
 
+# dbcmd is called for each log record, so the name of the DbServer host
+# is resolved only once per process
+_gethostbyname = functools.lru_cache()(socket.gethostbyname)
+
 
 def dbcmd(action, *args):
     """
@@ -44,7 +49,7 @@ def dbcmd(action, *args):
     :param string action: database action to perform
     :param tuple args: arguments
     """
-    host = socket.gethostbyname(config.dbserver.host)
+    host = _gethostbyname(config.dbserver.host)
     sock = zeromq.Socket(
         'tcp://%s:%s' % (host, DBSERVER_PORT), zeromq.zmq.REQ, 'connect')
     with sock:
@@ -704,6 +704,13 @@ U64 = numpy.uint64
 F32 = numpy.float32
 F64 = numpy.float64
 
+# groups of calculation modes, shared by all OqParam instances
+EVENT_BASED_MODES = frozenset([
+    'event_based', 'event_based_risk', 'ebrisk', 'event_based_damage',
+    'ucerf_hazard'])
+CLASSICAL_DISAGG_MODES = frozenset(['classical', 'disaggregation'])
+SAME_LEVELS_MODES = CLASSICAL_DISAGG_MODES | {'classical_risk'}
+
 
 def check_same_levels(imtls):
     """
@@ -1127,8 +1134,7 @@ class OqParam(valid.ParamSet):
 
         # check for amplification
         if ('amplification' in self.inputs and self.imtls and
-                self.calculation_mode in ['classical', 'classical_risk',
-                                          'disaggregation']):
+                self.calculation_mode in SAME_LEVELS_MODES):
             check_same_levels(self.imtls)
 
         if ('amplification' in self.inputs and
@@ -1254,22 +1260,24 @@ class OqParam(valid.ParamSet):
         """
         :returns: a dictionary of intensities, one per IMT
         """
+        imtls = self.imtls  # the property builds a new DictArray each time
         mini = self.minimum_intensity
         if mini:
-            for imt in self.imtls:
+            for imt in imtls:
                 try:
                     mini[imt] = calc.filters.getdefault(mini, imt)
                 except KeyError:
                     mini[imt] = 0
         if 'default' in mini:
             del mini['default']
-        return numpy.array([mini.get(imt) or 1E-10 for imt in self.imtls])
+        return numpy.array([mini.get(imt) or 1E-10 for imt in imtls])
 
     def levels_per_imt(self):
         """
         :returns: the number of levels per IMT (a.ka. L1)
         """
-        return self.imtls.size // len(self.imtls)
+        imtls = self.imtls
+        return imtls.size // len(imtls)
 
     def set_risk_imts(self, risklist):
         """
@@ -1515,8 +1523,7 @@ class OqParam(valid.ParamSet):
         """
         The calculation mode is event_based, event_based_risk or ebrisk
         """
-        return (self.calculation_mode in
-                'event_based_risk ebrisk event_based_damage ucerf_hazard')
+        return self.calculation_mode in EVENT_BASED_MODES
 
     def is_ucerf(self):
         """
@@ -1653,8 +1660,8 @@ class OqParam(valid.ParamSet):
         must be set or extracted from the risk models.
         """
         invalid = self.no_imls() and not self.risk_files and (
-            self.hazard_curves_from_gmfs or self.calculation_mode in
-            ('classical', 'disaggregation'))
+            self.hazard_curves_from_gmfs or
+            self.calculation_mode in CLASSICAL_DISAGG_MODES)
         return not invalid
 
     def is_valid_soil_intensities(self):
@@ -33,7 +33,6 @@ import collections
 
 import numpy
 import pandas
-import requests
 
 from openquake.baselib import config, hdf5, parallel, InvalidFile
 from openquake.baselib.general import (
@@ -160,6 +159,7 @@ def normalize(key, fnames, base_path):
             val = normpath(val, base_path)
         elif '://' in val:
             # get the data from an URL
+            import requests  # slow to import, rarely needed
             resp = requests.get(val)
             _, val = val.rsplit('/', 1)
             with open(os.path.join(base_path, val), 'wb') as f:
@@ -241,6 +241,7 @@ def get_params(job_ini, kw={}):
     if isinstance(job_ini, pathlib.Path):
         job_ini = str(job_ini)
     if job_ini.startswith(('http://', 'https://')):
+        import requests  # slow to import, rarely needed
         resp = requests.get(job_ini)
         job_ini = gettemp(suffix='.zip')
         with open(job_ini, 'wb') as f:
@@ -1034,8 +1035,10 @@ def taxonomy_mapping(oqparam, taxonomies):
     dic = oqparam.inputs['taxonomy_mapping']
     if isinstance(dic, str):  # same file for all loss_types
         dic = {lt: dic for lt in oqparam.loss_types}
-    return {lt: _taxonomy_mapping(dic[lt], taxonomies)
-            for lt in oqparam.loss_types}
+    tmaps = {}  # filename -> mapping, each file is read only once
+    for fname in set(dic[lt] for lt in oqparam.loss_types):
+        tmaps[fname] = _taxonomy_mapping(fname, taxonomies)
+    return {lt: tmaps[dic[lt]] for lt in oqparam.loss_types}
 
 
 def _taxonomy_mapping(filename, taxonomies):
@@ -2081,13 +2081,15 @@ class GsimLogicTreeTestCase(unittest.TestCase):
 
 
 class LogicTreeProcessorTestCase(unittest.TestCase):
-    def setUp(self):
-        # this is an example with number_of_logic_tree_samples = 1
+    @classmethod
+    def setUpClass(cls):
+        # this is an example with number_of_logic_tree_samples = 1;
+        # the logic trees are only read by the tests, so parse them once
         oqparam = tests.get_oqparam('classical_job.ini')
-        self.source_model_lt = readinput.get_source_model_lt(oqparam)
-        self.gmpe_lt = readinput.get_gsim_lt(
+        cls.source_model_lt = readinput.get_source_model_lt(oqparam)
+        cls.gmpe_lt = readinput.get_gsim_lt(
             oqparam, ['Active Shallow Crust', 'Subduction Interface'])
-        self.seed = oqparam.random_seed
+        cls.seed = oqparam.random_seed
 
     def test_sample_source_model(self):
         [rlz] = self.source_model_lt
@@ -2103,10 +2105,11 @@ class LogicTreeProcessorTestCase(unittest.TestCase):
 
 
 class LogicTreeProcessorParsePathTestCase(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         oqparam = tests.get_oqparam('classical_job.ini')
-        self.source_model_lt = readinput.get_source_model_lt(oqparam)
-        self.gmpe_lt = readinput.get_gsim_lt(
+        cls.source_model_lt = readinput.get_source_model_lt(oqparam)
+        cls.gmpe_lt = readinput.get_gsim_lt(
             oqparam, ['Active Shallow Crust', 'Subduction Interface'])
 
     def test_parse_invalid_smlt(self):
@@ -60,6 +60,14 @@ SINGLE_PLANE_RUPTURE = os.path.join(
 MULTI_PLANES_RUPTURE = os.path.join(
     os.path.dirname(__file__), 'data', 'multi-planes-rupture.xml')
 
+# distributions and geometries shared by the expected sources, built once
+NPD = pmf.PMF([(0.3, geo.NodalPlane(strike=0.0, dip=90.0, rake=0.0)),
+               (0.7, geo.NodalPlane(strike=90.0, dip=45.0, rake=90.0))])
+HD = pmf.PMF([(0.5, 4.0), (0.5, 8.0)])
+POLYGON = geo.Polygon(
+    [geo.Point(-122.5, 37.5), geo.Point(-121.5, 37.5),
+     geo.Point(-121.5, 38.5), geo.Point(-122.5, 38.5)])
+
 
 class NrmlSourceToHazardlibTestCase(unittest.TestCase):
     """Tests for converting NRML source model objects to the hazardlib
@@ -91,11 +99,6 @@ class NrmlSourceToHazardlibTestCase(unittest.TestCase):
         tgr_mfd = mfd.TruncatedGRMFD(
             a_val=-3.5, b_val=1.0, min_mag=5.0, max_mag=6.5, bin_width=1.0)
 
-        np1 = geo.NodalPlane(strike=0.0, dip=90.0, rake=0.0)
-        np2 = geo.NodalPlane(strike=90.0, dip=45.0, rake=90.0)
-        npd = pmf.PMF([(0.3, np1), (0.7, np2)])
-        hd = pmf.PMF([(0.5, 4.0), (0.5, 8.0)])
-
         point = source.PointSource(
             source_id="2",
             name="point",
@@ -107,8 +110,8 @@ class NrmlSourceToHazardlibTestCase(unittest.TestCase):
             upper_seismogenic_depth=0.0,
             lower_seismogenic_depth=10.0,
             location=geo.Point(-122.0, 38.0),
-            nodal_plane_distribution=npd,
-            hypocenter_distribution=hd,
+            nodal_plane_distribution=NPD,
+            hypocenter_distribution=HD,
             temporal_occurrence_model=PoissonTOM(50.))
         return point
 
@@ -120,15 +123,6 @@ class NrmlSourceToHazardlibTestCase(unittest.TestCase):
                 0.0010614989, 8.8291627E-4, 7.3437777E-4, 6.108288E-4,
                 5.080653E-4])
 
-        np1 = geo.NodalPlane(strike=0.0, dip=90.0, rake=0.0)
-        np2 = geo.NodalPlane(strike=90.0, dip=45.0, rake=90.0)
-        npd = pmf.PMF([(0.3, np1), (0.7, np2)])
-        hd = pmf.PMF([(0.5, 4.0), (0.5, 8.0)])
-
-        polygon = geo.Polygon(
-            [geo.Point(-122.5, 37.5), geo.Point(-121.5, 37.5),
-             geo.Point(-121.5, 38.5), geo.Point(-122.5, 38.5)])
-
         area = source.AreaSource(
             source_id="1",
             name="Quito",
@@ -139,9 +133,9 @@ class NrmlSourceToHazardlibTestCase(unittest.TestCase):
             rupture_aspect_ratio=1.5,
             upper_seismogenic_depth=0.0,
             lower_seismogenic_depth=10.0,
-            nodal_plane_distribution=npd,
-            hypocenter_distribution=hd,
-            polygon=polygon,
+            nodal_plane_distribution=NPD,
+            hypocenter_distribution=HD,
+            polygon=POLYGON,
             area_discretization=1,
             temporal_occurrence_model=PoissonTOM(50.))
         return area
@@ -552,13 +546,6 @@ class AreaToPointsTestCase(unittest.TestCase):
         trunc_mfd = mfd.TruncatedGRMFD(
             a_val=2.1, b_val=4.2, bin_width=0.1, min_mag=6.55, max_mag=8.91
         )
-        np1 = geo.NodalPlane(strike=0.0, dip=90.0, rake=0.0)
-        np2 = geo.NodalPlane(strike=90.0, dip=45.0, rake=90.0)
-        npd = pmf.PMF([(0.3, np1), (0.7, np2)])
-        hd = pmf.PMF([(0.5, 4.0), (0.5, 8.0)])
-        polygon = geo.Polygon(
-            [geo.Point(-122.5, 37.5), geo.Point(-121.5, 37.5),
-             geo.Point(-121.5, 38.5), geo.Point(-122.5, 38.5)])
         area = source.AreaSource(
             source_id="1",
             name="source A",
@@ -569,9 +556,9 @@ class AreaToPointsTestCase(unittest.TestCase):
             rupture_aspect_ratio=1.0,
             upper_seismogenic_depth=0.0,
             lower_seismogenic_depth=10.0,
-            nodal_plane_distribution=npd,
-            hypocenter_distribution=hd,
-            polygon=polygon,
+            nodal_plane_distribution=NPD,
+            hypocenter_distribution=HD,
+            polygon=POLYGON,
             area_discretization=10,
             temporal_occurrence_model=PoissonTOM(50.))
         actual = list(area)
@@ -584,13 +571,6 @@ class AreaToPointsTestCase(unittest.TestCase):
             occurrence_rates=[
                 0.0010614989, 8.8291627E-4, 7.3437777E-4, 6.108288E-4,
                 5.080653E-4])
-        np1 = geo.NodalPlane(strike=0.0, dip=90.0, rake=0.0)
-        np2 = geo.NodalPlane(strike=90.0, dip=45.0, rake=90.0)
-        npd = pmf.PMF([(0.3, np1), (0.7, np2)])
-        hd = pmf.PMF([(0.5, 4.0), (0.5, 8.0)])
-        polygon = geo.Polygon(
-            [geo.Point(-122.5, 37.5), geo.Point(-121.5, 37.5),
-             geo.Point(-121.5, 38.5), geo.Point(-122.5, 38.5)])
         area = source.AreaSource(
             source_id="1",
             name="source A",
@@ -601,9 +581,9 @@ class AreaToPointsTestCase(unittest.TestCase):
             rupture_aspect_ratio=1.0,
             upper_seismogenic_depth=0.0,
             lower_seismogenic_depth=10.0,
-            nodal_plane_distribution=npd,
-            hypocenter_distribution=hd,
-            polygon=polygon,
+            nodal_plane_distribution=NPD,
+            hypocenter_distribution=HD,
+            polygon=POLYGON,
             area_discretization=10,
             temporal_occurrence_model=PoissonTOM(50.0),
         )
@@ -114,11 +114,19 @@ class WriteCsvTestCase(unittest.TestCase):
         a = numpy.array([[1, 2], [3, 4]])
         self.assert_export(a, 'a,b\n1,2\n3,4\n', header='ab')
 
+    def test_empty_2d(self):
+        a = numpy.zeros((0, 2))
+        self.assert_export(a, 'a,b\n', header='ab')
+
     def test_flat(self):
         imt_dt = numpy.dtype([('PGA', I32, 3), ('PGV', I32, 4)])
         a = numpy.array([([1, 2, 3], [4, 5, 6, 7])], imt_dt)
         self.assert_export(a, 'PGA:3,PGV:4\n1 2 3,4 5 6 7\n')
 
+    def test_empty_composite(self):
+        dt = numpy.dtype([('lon', float), ('lat', float), ('PGA', float)])
+        self.assert_export(numpy.zeros(0, dt), 'lon,lat,PGA\n')
+
     def test_nested(self):
         imt_dt = numpy.dtype([('PGA', I32, 3), ('PGV', I32, 4)])
         gmf_dt = numpy.dtype([('A', imt_dt), ('B', imt_dt),
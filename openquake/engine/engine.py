@@ -30,6 +30,7 @@ import getpass
 import logging
 import itertools
 import platform
+from datetime import datetime
 from os.path import getsize
 import psutil
 import numpy
@@ -131,11 +132,10 @@ def expose_outputs(dstore, owner=getpass.getuser(), status='complete'):
         exportable.remove('ruptures')  # do not export, as requested by Vitor
     if 'hmaps' in dskeys and not oq.hazard_maps:
         dskeys.remove('hmaps')  # do not export the hazard maps
-    if logs.dbcmd('get_job', dstore.calc_id) is None:
-        # the calculation has not been imported in the db yet
-        logs.dbcmd('import_job', dstore.calc_id, oq.calculation_mode,
-                   oq.description + ' [parent]', owner, status,
-                   oq.hazard_calculation_id, dstore.datadir)
+    # import the calculation in the db, if it is not there already
+    logs.dbcmd('import_job', dstore.calc_id, oq.calculation_mode,
+               oq.description + ' [parent]', owner, status,
+               oq.hazard_calculation_id, dstore.datadir)
     keysize = []
     for key in sorted(dskeys & exportable):
         try:
@@ -286,6 +286,7 @@ def create_jobs(job_inis, log_level=logging.INFO, log_file=None,
         job_inis = job_inis[1:]
     else:
         jobs = []
+    dics = []
     for job_ini in job_inis:
         if isinstance(job_ini, dict):
             dic = job_ini
@@ -302,12 +303,17 @@ def create_jobs(job_inis, log_level=logging.INFO, log_file=None,
                 for param, value in pars.items():
                     jobdic[param] = str(value)
                 jobdic['description'] = '%s %s' % (dic['description'], pars)
-                new = logs.init('job', jobdic, log_level, None,
-                                user_name, hc_id)
-                jobs.append(new)
+                dics.append(jobdic)
         else:
-            jobs.append(
-                logs.init('job', dic, log_level, None, user_name, hc_id))
+            dics.append(dic)
+    if dics:  # create all the job records with a single database call
+        calc_ids = logs.dbcmd(
+            'create_jobs', logs.get_datadir(),
+            [(dic['calculation_mode'], dic['description']) for dic in dics],
+            user_name, hc_id)
+        for calc_id, dic in zip(calc_ids, dics):
+            jobs.append(logs.init('calc%d' % calc_id, dic, log_level, None,
+                                  user_name, hc_id))
     if multi:
         for job in jobs:
             job.multi = True
@@ -326,14 +332,14 @@ def run_jobs(jobs):
         poll_queue(jobs[0].calc_id, poll_time=15)
         # wait for an empty slot or a CTRL-C
     except BaseException:
-        # the job aborted even before starting
-        for job in jobs:
-            logs.dbcmd('finish', job.calc_id, 'aborted')
+        # the job aborted even before starting; finish all jobs at once
+        dic = dict(is_running=False, status='aborted',
+                   stop_time=datetime.utcnow())
+        logs.dbcmd('update_jobs', [job.calc_id for job in jobs], dic)
         return jobs
     else:
-        for job in jobs:
-            dic = {'status': 'executing', 'pid': _PID}
-            logs.dbcmd('update_job', job.calc_id, dic)
+        dic = {'status': 'executing', 'pid': _PID}
+        logs.dbcmd('update_jobs', [job.calc_id for job in jobs], dic)
     try:
         if config.zworkers['host_cores'] and parallel.workers_status() == []:
             print('Asking the DbServer to start the workers')
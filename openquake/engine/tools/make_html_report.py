@@ -88,14 +88,11 @@ class HtmlTable(object):
         yield '</table>\n'
 
 
-JOB_STATS = '''
-SELECT id, user_name, start_time, stop_time, status,
-strftime('%s', stop_time) - strftime('%s', start_time) AS duration
-FROM job WHERE id=?x;
-'''
-
+# the job stats are the first 6 fields, the last one is the calc dir
 ALL_JOBS = '''
-SELECT id, user_name, status, ds_calc_dir FROM job
+SELECT id, user_name, start_time, stop_time, status,
+strftime('%s', stop_time) - strftime('%s', start_time) AS duration,
+ds_calc_dir FROM job
 WHERE start_time >= ?x AND start_time < ?x ORDER BY stop_time
 '''
 
@@ -167,11 +164,11 @@ def make_report(isodate='today'):
         'fetch', ALL_JOBS, isodate.isoformat(), isodate1.isoformat())
     page = '<h2>%d job(s) finished before midnight of %s</h2>' % (
         len(jobs), isodate)
-    for job_id, user, status, ds_calc in jobs:
+    for job in jobs:
+        (job_id, user, start_time, stop_time, status, duration,
+         ds_calc) = job
         tag_ids.append(job_id)
         tag_status.append(status)
-        [stats] = logs.dbcmd('fetch', JOB_STATS, job_id)
-        (job_id, user, start_time, stop_time, status, duration) = stats
         try:
             ds = datastore.read(job_id, datadir=os.path.dirname(ds_calc))
             txt = view_fullreport('fullreport', ds)
@@ -182,7 +179,7 @@ def make_report(isodate='today'):
                     str(exc), quote=True),
                 fragment='')
         page = report['html_title']
-        page += htmltable([stats._fields, stats])
+        page += htmltable([job._fields[:6], job[:6]])
         page += report['fragment']
         tag_contents.append(page)
 
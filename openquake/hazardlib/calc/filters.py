@@ -417,6 +417,30 @@ class SourceFilter(object):
         sids.sort()
         return sids
 
+    def count_close_sites(self, recs, trt):
+        """
+        Vectorized version of `len(close_sids(rec, trt))`, performing
+        a single query on the k-d tree for all the given records.
+
+        :param recs: an array of rupture records
+        :param trt: tectonic region type string
+        :returns: an array with the number of close sites for each record
+        """
+        if self.sitecol is None:
+            return numpy.zeros(len(recs), U32)
+        elif not self.integration_distance:  # do not filter
+            return numpy.full(len(recs), len(self.sitecol), U32)
+        dlon = get_longitudinal_extent(recs['minlon'], recs['maxlon']) / 2.
+        dlat = (recs['maxlat'] - recs['minlat']) / 2.
+        dists = self.integration_distance(trt) + numpy.sqrt(
+            dlon**2 + dlat**2) / KM_TO_DEGREES + 10  # see close_sids
+        if not hasattr(self, 'kdt'):
+            self.kdt = cKDTree(self.sitecol.xyz)
+        hypo = recs['hypo']
+        xyz = spherical_to_cartesian(hypo[:, 0], hypo[:, 1], hypo[:, 2])
+        return self.kdt.query_ball_point(
+            xyz, dists, eps=.001, return_length=True)
+
     def filter(self, sources):
         """
         :param sources: a sequence of sources
@@ -132,17 +132,22 @@ class GmfComputer(object):
         self.cross_correl = cross_correl or NoCrossCorrelation(
             cmaker.trunclevel)
 
-    def compute_all(self, sig_eps=None):
+    def compute_all(self, sig_eps=None, mean_stds=None):
         """
-        :returns: (dict with fields eid, sid, gmv_X, ...), dt
+        :param sig_eps: if not None, a list to populate with sig/eps tuples
+        :param mean_stds:
+            array of shape (4, G, M, N) if already computed, possibly in a
+            single call for several ruptures, otherwise None
+        :returns: a dict with the arrays sid, eid, rlz, gmv_X, ...
         """
-        min_iml = self.cmaker.min_iml
+        min_iml = numpy.array(self.cmaker.min_iml)
         rlzs_by_gsim = self.cmaker.gsims
         sids = self.ctx.sids
         eids_by_rlz = self.ebrupture.get_eids_by_rlz(rlzs_by_gsim)
         mag = self.ebrupture.rupture.mag
         data = AccumDict(accum=[])
-        mean_stds = self.cmaker.get_mean_stds([self.ctx])  # (4, G, M, N)
+        if mean_stds is None:
+            mean_stds = self.cmaker.get_mean_stds([self.ctx])  # (4, G, M, N)
         for g, (gs, rlzs) in enumerate(rlzs_by_gsim.items()):
             num_events = sum(len(eids_by_rlz[rlz]) for rlz in rlzs)
             if num_events == 0:  # it may happen
@@ -152,39 +157,38 @@ class GmfComputer(object):
             # it is better to have few calls producing big arrays
             array, sig, eps = self.compute(gs, num_events, mean_stds[:, g])
             M, N, E = array.shape  # sig and eps have shapes (M, E) instead
-            for n in range(N):
-                for e in range(E):
-                    if (array[:, n, e] < min_iml).all():
-                        array[:, n, e] = 0
-            array = array.transpose(1, 0, 2)  # from M, N, E to N, M, E
+            # zero the (site, event) pairs below the minimum intensity
+            # for all the IMTs in a single vectorized operation
+            array[:, (array < min_iml[:, None, None]).all(axis=0)] = 0
+            array = array.transpose(2, 1, 0)  # from M, N, E to E, N, M
             n = 0
             for rlz in rlzs:
                 eids = eids_by_rlz[rlz]
-                for ei, eid in enumerate(eids):
-                    gmfa = array[:, :, n + ei]  # shape (N, M)
-                    if sig_eps is not None:
+                gmfs = array[n:n + len(eids)]  # shape (E', N, M)
+                if sig_eps is not None:
+                    for ei, eid in enumerate(eids):
                         tup = tuple([eid, rlz] + list(sig[:, n + ei]) +
                                     list(eps[:, n + ei]))
                         sig_eps.append(tup)
-                    items = []
-                    for sp in self.sec_perils:
+                # gmv can be zero due to the minimum_intensity, coming
+                # from the job.ini or from the vulnerability functions;
+                # the nonzero pairs are ordered by event and then by site
+                ok = gmfs.sum(axis=2) > 0  # shape (E', N)
+                ee, ss = ok.nonzero()
+                data['sid'].append(sids[ss])
+                data['eid'].append(eids[ee])
+                # rlz is used in compute_gmfs_curves
+                data['rlz'].append(numpy.full(len(ee), rlz, U32))
+                for m in range(M):
+                    data[f'gmv_{m}'].append(gmfs[ee, ss, m])
+                for sp in self.sec_perils:
+                    for ei, gmfa in enumerate(gmfs):
                         o = sp.compute(mag, zip(self.imts, gmfa.T), self.ctx)
                         for outkey, outarr in zip(sp.outputs, o):
-                            items.append((outkey, outarr))
-                    for i, gmv in enumerate(gmfa):
-                        if gmv.sum() == 0:
-                            continue
-                        data['sid'].append(sids[i])
-                        data['eid'].append(eid)
-                        data['rlz'].append(rlz)  # used in compute_gmfs_curves
-                        for m in range(M):
-                            data[f'gmv_{m}'].append(gmv[m])
-                        for outkey, outarr in items:
-                            data[outkey].append(outarr[i])
-                        # gmv can be zero due to the minimum_intensity, coming
-                        # from the job.ini or from the vulnerability functions
+                            data[outkey].append(numpy.asarray(outarr)[ok[ei]])
                 n += len(eids)
-        return data
+        return {key: numpy.concatenate(arrays)
+                for key, arrays in data.items()}
 
     def compute(self, gsim, num_events, mean_stds):
         """
@@ -113,27 +113,28 @@ def get_rup_array(ebruptures, srcfilter=nofilter):
             assert s2 < TWO16, 'The rupture mesh spacing is too small'
             shapes.append(s1)
             shapes.append(s2)
-            points.extend(array.flat)
+            points.append(F32(array).ravel())
             # example of points: [25.0, 25.1, 25.1, 25.0,
             #                     -24.0, -24.0, -24.1, -24.1,
             #                      5.0, 5.0, 5.0, 5.0]
-        points = F32(points)
+        # concatenate the float32 arrays without passing through Python floats
+        points = numpy.concatenate(points)
         shapes = U32(shapes)
         hypo = rup.hypocenter.x, rup.hypocenter.y, rup.hypocenter.z
-        rec = numpy.zeros(1, rupture_dt)[0]
-        rec['seed'] = rup.rup_id
         n = len(points) // 3
         lons = points[0:n]
         lats = points[n:2*n]
-        rec['minlon'] = minlon = numpy.nanmin(lons)  # NaNs are in KiteSurfaces
-        rec['minlat'] = minlat = numpy.nanmin(lats)
-        rec['maxlon'] = maxlon = numpy.nanmax(lons)
-        rec['maxlat'] = maxlat = numpy.nanmax(lats)
-        rec['mag'] = rup.mag
-        rec['hypo'] = hypo
-        if srcfilter.integration_distance and len(
-                srcfilter.close_sids(rec, rup.tectonic_region_type)) == 0:
-            continue
+        minlon = numpy.nanmin(lons)  # NaNs are in KiteSurfaces
+        minlat = numpy.nanmin(lats)
+        maxlon = numpy.nanmax(lons)
+        maxlat = numpy.nanmax(lats)
+        if srcfilter.integration_distance:
+            # close_sids only needs the bounding box and the hypocenter,
+            # so there is no need to build a full rupture record
+            rec = dict(minlon=minlon, minlat=minlat, maxlon=maxlon,
+                       maxlat=maxlat, hypo=F32(hypo))
+            if len(srcfilter.close_sids(rec, rup.tectonic_region_type)) == 0:
+                continue
         rate = getattr(rup, 'occurrence_rate', numpy.nan)
         tup = (0, ebrupture.rup_id, ebrupture.source_id, ebrupture.trt_smr,
                rup.code, ebrupture.n_occ, rup.mag, rup.rake, rate,
@@ -149,6 +149,7 @@ class MultiSurface(BaseSurface):
         """
         self.surfaces = surfaces
         self.areas = None
+        self.strike = self.dip = None  # computed lazily and cached
         self.edge_set = self._get_edge_set(tol)
         self.cartesian_edges = []
         self.cartesian_endpoints = []
@@ -294,13 +295,16 @@ class MultiSurface(BaseSurface):
         Note that the original formula has been adapted to compute a weighted
         rather than arithmetic mean.
         """
+        if self.strike is not None:
+            return self.strike
         areas = self._get_areas()
         strikes = numpy.array([surf.get_strike() for surf in self.surfaces])
         v1 = (numpy.sum(areas * numpy.sin(numpy.radians(strikes))) /
               numpy.sum(areas))
         v2 = (numpy.sum(areas * numpy.cos(numpy.radians(strikes))) /
               numpy.sum(areas))
-        return numpy.degrees(numpy.arctan2(v1, v2)) % 360
+        self.strike = numpy.degrees(numpy.arctan2(v1, v2)) % 360
+        return self.strike
 
     def get_dip(self):
         """
@@ -310,6 +314,8 @@ class MultiSurface(BaseSurface):
         Given that dip values are constrained in the range (0, 90], the simple
         formula for weighted mean is used.
         """
+        if self.dip is not None:
+            return self.dip
         areas = self._get_areas()
         dips = numpy.array([numpy.mean(surf.get_dip()) for surf in
                             self.surfaces])
@@ -320,6 +326,7 @@ class MultiSurface(BaseSurface):
 
         dip = numpy.sum(areas * dips) / numpy.sum(areas)
         assert numpy.isfinite(dip).all()
+        self.dip = dip
         return dip
 
     def get_width(self):
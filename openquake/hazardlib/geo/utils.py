@@ -737,3 +737,33 @@ def geohash(lon, lat, length):
             bit = 0
             ch = 0
     return chars
+
+
+def geohash_array(lons, lats, length):
+    """
+    Vectorized version of :func:`geohash`, interleaving the bits of
+    all the positions at once.
+
+    >>> geohash_array([10, 15], [45, 40], length=5)
+    array([b'spzpg', b'sr4et'], dtype='|S5')
+    """
+    lons = numpy.asarray(lons, float)
+    lats = numpy.asarray(lats, float)
+    n = len(lons)
+    intervals = [[numpy.full(n, -180.), numpy.full(n, 180.), lons],
+                 [numpy.full(n, -90.), numpy.full(n, 90.), lats]]
+    base32 = numpy.frombuffer(b''.join(BASE32), numpy.uint8)
+    chars = numpy.zeros((n, length), numpy.uint8)
+    even = True
+    for c in range(length):
+        ch = numpy.zeros(n, numpy.uint8)
+        for bit in (16, 8, 4, 2, 1):
+            low, high, coords = intervals[0 if even else 1]
+            mid = (low + high) / 2
+            gt = coords > mid
+            ch[gt] |= bit
+            low[gt] = mid[gt]
+            high[~gt] = mid[~gt]
+            even = not even
+        chars[:, c] = base32[ch]
+    return chars.view((numpy.string_, length))[:, 0]
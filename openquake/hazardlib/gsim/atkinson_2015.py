@@ -27,6 +27,8 @@ from openquake.hazardlib.gsim.base import GMPE, CoeffsTable
 from openquake.hazardlib import const
 from openquake.hazardlib.imt import PGA, PGV, SA
 
+LOG10 = np.log(10.)
+
 
 def _get_magnitude_term(C, mag):
     """
@@ -61,9 +63,7 @@ def _get_stddevs(C):
     """
     Return standard deviations, converting from log10 to log
     """
-    return [np.log(10.0 ** C["sigma"]),
-            np.log(10.0 ** C["tau"]),
-            np.log(10.0 ** C["phi"])]
+    return C["sigma"] * LOG10, C["tau"] * LOG10, C["phi"] * LOG10
 
 
 class Atkinson2015(GMPE):
@@ -110,9 +110,9 @@ class Atkinson2015(GMPE):
                      _get_distance_term(C, ctx.rhypo, ctx.mag))
             # Convert mean from cm/s and cm/s/s
             if imt.string.startswith(('PGA', 'SA')):
-                mean[m] = np.log((10.0 ** (imean - 2.0)) / g)
+                mean[m] = (imean - 2.0) * LOG10 - np.log(g)
             else:
-                mean[m] = np.log(10.0 ** imean)
+                mean[m] = imean * LOG10
             sig[m], tau[m], phi[m] = _get_stddevs(C)
 
     COEFFS = CoeffsTable(sa_damping=5, table="""
@@ -24,10 +24,12 @@ Module exports :class:`BindiEtAl2014Rjb`,
                :class:`BindiEtAl2014RhypEC8`,
                :class:`BindiEtAl2014RhypEC8NoSOF`
 """
+import math
+import functools
 import numpy as np
 from scipy.constants import g
 
-from openquake.baselib.general import CallableDict
+from openquake.baselib.performance import compile, numba
 from openquake.hazardlib.gsim.base import GMPE, CoeffsTable
 from openquake.hazardlib import const
 from openquake.hazardlib.imt import PGA, PGV, SA
@@ -37,92 +39,161 @@ CONSTS = {"Mref": 5.5,
           "Rref": 1.0,
           "Vref": 800.0}
 
+LOG10 = np.log(10.)
+LOG_G = np.log(g)
+LOG_VREF = np.log(CONSTS["Vref"])
+MREF = CONSTS["Mref"]  # a global float, usable by numba
+# coefficients of the magnitude and distance terms
+MEAN_COEFFS = ["e1", "b1", "b2", "b3", "c1", "c2", "c3", "h"]
 
-def _get_distance_scaling_term(C, rval, mag):
+
+@functools.lru_cache()
+def _get_ln_coeffs(coeffs):
     """
-    Returns the distance scaling term of the GMPE described in equation 2
+    :param coeffs: a CoeffsTable with coefficients for base 10 logarithms
+    :returns: a CoeffsTable with all the coefficients, except h and gamma,
+        multiplied by ln(10), so that the model directly returns natural
+        logarithms
+
+    The mean is linear in all the coefficients except h, so this is
+    equivalent to multiplying the base 10 mean and stddevs by ln(10).
+    Moreover gamma * log10(vs30 / Vref) * ln(10) is equal to
+    gamma * ln(vs30) - gamma * ln(Vref): gamma is kept as it is, to be
+    multiplied by ln(vs30), and the constant part is folded into e1.
     """
-    r_adj = np.sqrt(rval ** 2.0 + C["h"] ** 2.0)
-    return (
-        (C["c1"] + C["c2"] * (mag - CONSTS["Mref"])) *
-        np.log10(r_adj / CONSTS["Rref"]) -
-        (C["c3"] * (r_adj - CONSTS["Rref"])))
-
-
-def _get_magnitude_scaling_term(C, mag):
+    ddic = {}
+    for imt, C in {**coeffs.non_sa_coeffs, **coeffs.sa_coeffs}.items():
+        dic = ddic[imt] = {
+            name: C[name] if name in ('h', 'gamma') else C[name] * LOG10
+            for name in C.dtype.names}
+        if 'gamma' in dic:
+            dic['e1'] -= C['gamma'] * LOG_VREF
+    return CoeffsTable.fromdict(ddic, coeffs.logratio)
+
+
+# since Rref = 1, log10(r_adj / Rref) = log10(r_adj), with
+# r_adj = hypot(dist, h) computed without squaring the distances
+if numba:
+
+    @compile("void(float64[:], float64[:], float64, float64, float64, "
+             "float64, float64[:])")
+    def _add_distance_term(dists, mag, c1, c2, c3, h, out):
+        # add the distance term to the other terms already in `out`,
+        # site by site, in a single pass without temporary arrays
+        for i in range(len(dists)):
+            r = math.hypot(dists[i], h)
+            cmag = c1 + c2 * (mag[i] - MREF)
+            out[i] += cmag * math.log10(r) - c3 * (r - 1.)
+else:
+
+    def _add_distance_term(dists, mag, c1, c2, c3, h, out):
+        # add the distance term with numpy, working in place on
+        # the buffers to limit the number of temporary arrays
+        cmag = c2 * (mag - MREF)
+        cmag += c1
+        r = np.hypot(dists, h)
+        out += cmag * np.log10(r)
+        r -= 1.
+        r *= c3
+        out -= r
+
+
+def _get_magnitude_scaling_term(e1, b1, b2, b3, mag):
     """
     Returns the magnitude scaling term of the GMPE described in
     equation 3
     """
     dmag = mag - CONSTS["Mh"]
-    if mag < CONSTS["Mh"]:
-        return C["e1"] + (C["b1"] * dmag) + (C["b2"] * (dmag ** 2.0))
-    else:
-        return C["e1"] + (C["b3"] * dmag)
+    return e1 + np.where(mag < CONSTS["Mh"],
+                         b1 * dmag + b2 * dmag * dmag, b3 * dmag)
+
+
+def _no_style_of_faulting_term(C, sof):
+    return 0.
+
+
+@functools.lru_cache()
+def _get_mean_function(site_term, sof):
+    """
+    :returns: a function (C, mc, mag, dists, site, sof, mags, inv) -> mean
+        ground motion, specialized for the given site term and
+        style-of-faulting flag; `mc` are the MEAN_COEFFS of C as Python
+        floats, `mags` are the distinct magnitudes and mags[inv] == mag
+    """
+    sof_term = (_get_style_of_faulting_term if sof
+                else _no_style_of_faulting_term)
+
+    def get_mean(C, mc, mag, dists, site, sof, mags, inv):
+        e1, b1, b2, b3, c1, c2, c3, h = mc
+        out = _get_magnitude_scaling_term(e1, b1, b2, b3, mags)[inv]
+        out += site_term(C, site)
+        out += sof_term(C, sof)
+        _add_distance_term(dists, mag, c1, c2, c3, h, out)
+        return out
+    return get_mean
 
 
-def _get_mean(kind, sof, C, ctx, dists):
+def _get_site_variable_1(vs30):
     """
-    Returns the mean ground motion
+    Returns ln(vs30), which is the same for all IMTs; the -ln(Vref) part
+    of the site term is folded into the coefficient e1 by _get_ln_coeffs
     """
-    sof_term = _get_style_of_faulting_term(C, ctx) if sof else 0.
-    return (_get_magnitude_scaling_term(C, ctx.mag) +
-            _get_distance_scaling_term(C, dists, ctx.mag) +
-            _get_site_amplification_term(kind, C, ctx.vs30) + sof_term)
+    return np.log(vs30)
 
 
-_get_site_amplification_term = CallableDict()
+def _get_site_variable_2(vs30):
+    """
+    Returns the index of the Eurocode 8 site class, which is the same
+    for all IMTs: 0, 1, 2, 3 for the classes D, C, B and A, i.e. for vs30
+    in [0, 180), [180, 360), [360, 800) and [800, inf) respectively
+    """
+    return np.searchsorted([180.0, 360.0, 800.0], vs30, side='right')
 
 
-@_get_site_amplification_term.add("base")
-def _get_site_amplification_term_1(kind, C, vs30):
+def _get_site_amplification_term_1(C, site):
     """
     Returns the site amplification term for the case in which Vs30
     is used directly
     """
-    return C["gamma"] * np.log10(vs30 / CONSTS["Vref"])
+    return C["gamma"] * site
 
 
-@_get_site_amplification_term.add("EC8")
-def _get_site_amplification_term_2(kind, C, vs30):
+def _get_site_amplification_term_2(C, site):
     """
     Returns the site amplification given Eurocode 8 site classification
     """
-    f_s = np.zeros_like(vs30)
-    # Site class B
-    idx = np.logical_and(vs30 < 800.0, vs30 >= 360.0)
-    f_s[idx] = C["eB"]
-    # Site Class C
-    idx = np.logical_and(vs30 < 360.0, vs30 >= 180.0)
-    f_s[idx] = C["eC"]
-    # Site Class D
-    idx = vs30 < 180.0
-    f_s[idx] = C["eD"]
-    return f_s
-
-
-def _get_style_of_faulting_term(C, ctx):
+    return np.array([C["eD"], C["eC"], C["eB"], 0.0])[site]
+
+
+# site functions (variable, term) for each kind of site amplification
+SITE_FUNCTIONS = {
+    "base": (_get_site_variable_1, _get_site_amplification_term_1),
+    "EC8": (_get_site_variable_2, _get_site_amplification_term_2)}
+
+
+def _get_style_of_faulting_index(rake):
     """
-    Returns the style-of-faulting term.
-    Fault type (Strike-slip, Normal, Thrust/reverse) is
-    derived from rake angle.
+    Returns the index of the fault type, which is the same for all IMTs:
+    0, 1, 2 for Normal, Thrust/reverse and Strike-slip respectively.
+    Fault type is derived from rake angle.
     Rakes angles within 30 of horizontal are strike-slip,
     angles from 30 to 150 are reverse, and angles from
     -30 to -150 are normal.
     Note that the 'Unspecified' case is not considered in this class
     as rake is required as an input variable
     """
-    SS, NS, RS = 0.0, 0.0, 0.0
-    if np.abs(ctx.rake) <= 30.0 or (180.0 - np.abs(ctx.rake)) <= 30.0:
-        # strike-slip
-        SS = 1.0
-    elif ctx.rake > 30.0 and ctx.rake < 150.0:
-        # reverse
-        RS = 1.0
-    else:
-        # normal
-        NS = 1.0
-    return (C["sofN"] * NS) + (C["sofR"] * RS) + (C["sofS"] * SS)
+    abs_rake = np.abs(rake)
+    idx = np.zeros(np.shape(rake), np.uint8)
+    idx[(rake > 30.0) & (rake < 150.0)] = 1
+    idx[(abs_rake <= 30.0) | (180.0 - abs_rake <= 30.0)] = 2
+    return idx
+
+
+def _get_style_of_faulting_term(C, sof):
+    """
+    Returns the style-of-faulting term, given the fault type indices
+    """
+    return np.array([C["sofN"], C["sofR"], C["sofS"]])[sof]
 
 
 class BindiEtAl2014Rjb(GMPE):
@@ -180,6 +251,13 @@ class BindiEtAl2014Rjb(GMPE):
         super().__init__(adjustment_factor=adjustment_factor, **kwargs)
         self.adjustment_factor = np.log(adjustment_factor)
         [self.dist_type] = self.REQUIRES_DISTANCES
+        # bind the site functions once instead of dispatching on kind
+        self._get_site_variable, self._get_site_amplification_term = (
+            SITE_FUNCTIONS[self.kind])
+        # constant offsets of the means in natural logarithm: the PGA/SA
+        # ones are converted from cm/s^2 to g, then both are adjusted
+        self.offset = {'PGV': self.adjustment_factor,
+                       'PGA_SA': self.adjustment_factor - 2.0 * LOG10 - LOG_G}
 
     def compute(self, ctx, imts, mean, sig, tau, phi):
         """
@@ -188,21 +266,34 @@ class BindiEtAl2014Rjb(GMPE):
         for spec of input and result values.
         """
         dists = getattr(ctx, self.dist_type)
-        for m, imt in enumerate(imts):
-            C = self.COEFFS[imt]
-            imean = _get_mean(self.kind, self.sof, C, ctx, dists)
-            if imt.string.startswith(('PGA', 'SA')):
-                # Convert units to g,
-                # but only for PGA and SA (not PGV)
-                mean[m] = np.log((10.0 ** (imean - 2.0)) / g)
-            else:
-                # PGV
-                mean[m] = np.log(10.0 ** imean)
-
-            mean[m] += self.adjustment_factor
-            sig[m] = np.log(10.0 ** C['sigma'])
-            tau[m] = np.log(10.0 ** C['tau'])
-            phi[m] = np.log(10.0 ** C['phi'])
+        site = self._get_site_variable(ctx.vs30)
+        sof = _get_style_of_faulting_index(ctx.rake) if self.sof else None
+        # the magnitude of each row, also for a RuptureContext with a
+        # scalar magnitude, as required by the distance term
+        mag = (np.full_like(dists, ctx.mag) if np.ndim(ctx.mag) == 0
+               else ctx.mag)
+        # many rows share the same rupture, so the magnitude term is
+        # computed on the distinct magnitudes only and then expanded
+        mags, inv = np.unique(mag, return_inverse=True)
+        coeffs = _get_ln_coeffs(self.COEFFS)  # natural log coefficients
+        # the coefficients of all IMTs in a single structured array, so
+        # that a column like C['sigma'] contains the values for each IMT
+        C = np.array([coeffs[imt] for imt in imts], coeffs.rb.dtype)
+        # Convert units to g, but only for PGA and SA (not PGV)
+        offset = np.array([self.offset['PGA_SA']
+                           if imt.string.startswith(('PGA', 'SA'))
+                           else self.offset['PGV'] for imt in imts])
+        get_mean = _get_mean_function(
+            self._get_site_amplification_term, self.sof)
+        # the coefficients of the magnitude and distance terms are
+        # converted into tuples of floats in a single call
+        mcs = C[MEAN_COEFFS].tolist()
+        for m, mc in enumerate(mcs):
+            mean[m] = get_mean(C[m], mc, mag, dists, site, sof, mags, inv)
+            mean[m] += offset[m]
+        sig[:] = C['sigma'][:, None]
+        tau[:] = C['tau'][:, None]
+        phi[:] = C['phi'][:, None]
 
     #: Coefficients from Table 2
 
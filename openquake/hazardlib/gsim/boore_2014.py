@@ -48,7 +48,7 @@ def _get_basin_depth_term(region, C, ctx, period):
         return np.zeros(len(ctx.vs30), dtype=float)
     bmodel = (japan_basin_model(ctx.vs30) if region == "JPN"
               else california_basin_model(ctx.vs30))
-    f_dz1 = C["f7"] + np.zeros(len(ctx.vs30), dtype=float)
+    f_dz1 = np.full(len(ctx.vs30), C["f7"])
     f_ratio = C["f7"] / C["f6"]
     dz1 = (ctx.z1pt0 / 1000.0) - bmodel
     idx = dz1 <= f_ratio
@@ -107,7 +107,7 @@ def _compute_hanging_wall_effect(C, rjb, rrup, dip, mag):
     f_m = 1 if mag > 6.5 else mag - 5.5
 
     # eq. 10
-    f_rrup = C['c15'] + np.zeros_like(rrup)
+    f_rrup = np.full_like(rrup, C['c15'])
     idx = rrup < 8
     f_rrup[idx] *= rrup[idx] / 8
 
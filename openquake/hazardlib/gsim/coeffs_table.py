@@ -17,6 +17,7 @@
 # along with OpenQuake.  If not, see <http://www.gnu.org/licenses/>.
 
 import math
+import numpy
 from openquake.baselib.general import RecordBuilder
 from openquake.hazardlib.imt import from_string
 
@@ -162,14 +163,26 @@ class CoeffsTable(object):
         if not header[0].upper() == "IMT":
             raise ValueError('first column in a table must be IMT')
         dt = RecordBuilder(**{name: 0. for name in header[1:]})
+        ncols = len(dt.names)
+        imts, cells = [], []
         for line in lines:
             row = line.split()
             imt_name_or_period = row[0].upper()
             if imt_name_or_period == 'SA':  # protect against stupid mistakes
                 raise ValueError('specify period as float value '
                                  'to declare SA IMT')
-            imt = from_string(imt_name_or_period, sa_damping)
-            self._coeffs[imt] = dt(*row[1:])
+            imts.append(from_string(imt_name_or_period, sa_damping))
+            # as in RecordBuilder, extra cells are ignored and missing
+            # cells default to 0; some tables have trailing columns
+            cells.append((row[1:] + ['0'] * ncols)[:ncols])
+        # convert all the cells in a single numpy call and store the
+        # coefficients in a contiguous structured array, by viewing each
+        # row of floats as a record; the records returned by __getitem__
+        # are views over its rows
+        values = numpy.array(cells, float).reshape(len(cells), ncols)
+        self.array = values.view(dt.dtype)[:, 0]
+        for imt, rec in zip(imts, self.array):
+            self._coeffs[imt] = rec
         return dt
 
     @property
@@ -199,8 +212,9 @@ class CoeffsTable(object):
         except KeyError:  # populate the cache
             pass
 
+        sa_coeffs = self.sa_coeffs  # build the dictionary only once
         max_below = min_above = None
-        for unscaled_imt in list(self.sa_coeffs):
+        for unscaled_imt in sa_coeffs:
             if unscaled_imt.damping != getattr(imt, 'damping', None):
                 pass
             elif unscaled_imt.period > imt.period:
@@ -220,8 +234,8 @@ class CoeffsTable(object):
         else:  # in the ACME project
             ratio = ((imt.period - max_below.period) /
                      (min_above.period - max_below.period))
-        below = self.sa_coeffs[max_below]
-        above = self.sa_coeffs[min_above]
+        below = sa_coeffs[max_below]
+        above = sa_coeffs[min_above]
         lst = [(above[n] - below[n]) * ratio + below[n] for n in self.rb.names]
         self._coeffs[imt] = c = self.rb(*lst)
         return c
@@ -123,11 +123,11 @@ def get_distance_coefficients_2(kind, c3, c3_epsilon, C, imt, sctx):
     if c3:
         # If c3 is input then this over-rides the regionalisation
         # assumed within this model
-        return c3[imt]["c3"] * np.ones(sctx.region.shape)
+        return np.full(sctx.region.shape, c3[imt]["c3"])
 
     # Default c3 and tau values to the original GMPE c3 and tau
-    c3_ = C["c3"] + np.zeros(sctx.region.shape)
-    tau_c3 = C["tau_c3"] + np.zeros(sctx.region.shape)
+    c3_ = np.full(sctx.region.shape, C["c3"])
+    tau_c3 = np.full(sctx.region.shape, C["tau_c3"])
     if not np.any(sctx.region) or ("PGV" in str(imt)):
         # No regionalisation - take the default C3 and multiply tau_c3
         # by the original epsilon
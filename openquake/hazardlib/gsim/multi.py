@@ -90,9 +90,14 @@ class MultiGMPE(GMPE):
         return len(self.kwargs)
 
     def __hash__(self):
-        items = tuple((imt, str(gsim)) for imt, gsim in
-                      sorted(self.kwargs.items()))
-        return hash(items)
+        # the kwargs are fixed at instantiation time, so the hash is cached
+        try:
+            return self._hash
+        except AttributeError:
+            items = tuple((imt, str(gsim)) for imt, gsim in
+                          sorted(self.kwargs.items()))
+            self._hash = hash(items)
+            return self._hash
 
     def compute(self, ctx, imts, mean, sig, tau, phi):
         """
@@ -463,55 +463,24 @@ class ParkerEtAl2020SSlabB(ParkerEtAl2020SSlab):
     REQUIRES_SITES_PARAMETERS = {'vs30', 'z2pt5'}
 
 
-add_alias('ParkerEtAl2020SInterAleutian', ParkerEtAl2020SInter,
-          region="AK", saturation_region="Aleutian")
-add_alias('ParkerEtAl2020SInterAlaska', ParkerEtAl2020SInter,
-          region="AK")
-add_alias('ParkerEtAl2020SInterCAMN', ParkerEtAl2020SInter,
-          region="CAM", saturation_region="CAM_N")
-add_alias('ParkerEtAl2020SInterCAMS', ParkerEtAl2020SInter,
-          region="CAM", saturation_region="CAM_S")
-add_alias('ParkerEtAl2020SInterSAN', ParkerEtAl2020SInter,
-          region="SA", saturation_region="SA_N")
-add_alias('ParkerEtAl2020SInterSAS', ParkerEtAl2020SInter,
-          region="SA", saturation_region="SA_S")
-add_alias('ParkerEtAl2020SInterTaiwanE', ParkerEtAl2020SInter,
-          region="TW", saturation_region="TW_E")
-add_alias('ParkerEtAl2020SInterTaiwanW', ParkerEtAl2020SInter,
-          region="TW", saturation_region="TW_W")
-add_alias('ParkerEtAl2020SInterCascadia', ParkerEtAl2020SInterB,
-          region="Cascadia")
-add_alias('ParkerEtAl2020SInterCascadiaOut', ParkerEtAl2020SInterB,
-          region="Cascadia", basin="out")
-add_alias('ParkerEtAl2020SInterCascadiaSeattle', ParkerEtAl2020SInterB,
-          region="Cascadia", basin="Seattle")
-add_alias('ParkerEtAl2020SInterJapanPac', ParkerEtAl2020SInterB,
-          region="JP", saturation_region="JP_Pac")
-add_alias('ParkerEtAl2020SInterJapanPhi', ParkerEtAl2020SInterB,
-          region="JP", saturation_region="JP_Phi")
-add_alias('ParkerEtAl2020SSlabAleutian', ParkerEtAl2020SSlab,
-          region="AK", saturation_region="Aleutian")
-add_alias('ParkerEtAl2020SSlabAlaska', ParkerEtAl2020SSlab,
-          region="AK")
-add_alias('ParkerEtAl2020SSlabCAMN', ParkerEtAl2020SSlab,
-          region="CAM", saturation_region="CAM_N")
-add_alias('ParkerEtAl2020SSlabCAMS', ParkerEtAl2020SSlab,
-          region="CAM", saturation_region="CAM_S")
-add_alias('ParkerEtAl2020SSlabSAN', ParkerEtAl2020SSlab,
-          region="SA", saturation_region="SA_N")
-add_alias('ParkerEtAl2020SSlabSAS', ParkerEtAl2020SSlab,
-          region="SA", saturation_region="SA_S")
-add_alias('ParkerEtAl2020SSlabTaiwanE', ParkerEtAl2020SSlab,
-          region="TW", saturation_region="TW_E")
-add_alias('ParkerEtAl2020SSlabTaiwanW', ParkerEtAl2020SSlab,
-          region="TW", saturation_region="TW_W")
-add_alias('ParkerEtAl2020SSlabCascadia', ParkerEtAl2020SSlabB,
-          region="Cascadia")
-add_alias('ParkerEtAl2020SSlabCascadiaOut', ParkerEtAl2020SSlabB,
-          region="Cascadia", basin="out")
-add_alias('ParkerEtAl2020SSlabCascadiaSeattle', ParkerEtAl2020SSlabB,
-          region="Cascadia", basin="Seattle")
-add_alias('ParkerEtAl2020SSlabJapanPac', ParkerEtAl2020SSlabB,
-          region="JP", saturation_region="JP_Pac")
-add_alias('ParkerEtAl2020SSlabJapanPhi', ParkerEtAl2020SSlabB,
-          region="JP", saturation_region="JP_Phi")
+# (suffix, requires basins, parameters) of the regional aliases,
+# registered for both the interface and the in-slab models
+REGION_ALIASES = [
+    ('Aleutian', False, dict(region="AK", saturation_region="Aleutian")),
+    ('Alaska', False, dict(region="AK")),
+    ('CAMN', False, dict(region="CAM", saturation_region="CAM_N")),
+    ('CAMS', False, dict(region="CAM", saturation_region="CAM_S")),
+    ('SAN', False, dict(region="SA", saturation_region="SA_N")),
+    ('SAS', False, dict(region="SA", saturation_region="SA_S")),
+    ('TaiwanE', False, dict(region="TW", saturation_region="TW_E")),
+    ('TaiwanW', False, dict(region="TW", saturation_region="TW_W")),
+    ('Cascadia', True, dict(region="Cascadia")),
+    ('CascadiaOut', True, dict(region="Cascadia", basin="out")),
+    ('CascadiaSeattle', True, dict(region="Cascadia", basin="Seattle")),
+    ('JapanPac', True, dict(region="JP", saturation_region="JP_Pac")),
+    ('JapanPhi', True, dict(region="JP", saturation_region="JP_Phi"))]
+
+for cls, cls_b in [(ParkerEtAl2020SInter, ParkerEtAl2020SInterB),
+                   (ParkerEtAl2020SSlab, ParkerEtAl2020SSlabB)]:
+    for suffix, basins, kw in REGION_ALIASES:
+        add_alias(cls.__name__ + suffix, cls_b if basins else cls, **kw)
@@ -139,7 +139,7 @@ def get_stewart_2019_phis2s(imt, vs30):
     v_1 = 1200.
     v_2 = 1500.
     C = COEFFS_USGS_SIGMA_PANEL[imt]
-    phis2s = C["s2s1"] + np.zeros(vs30.shape)
+    phis2s = np.full(vs30.shape, C["s2s1"])
     idx = vs30 > v_2
     phis2s[idx] = C["s2s2"]
     idx = np.logical_and(vs30 > v_1, vs30 <= v_2)
@@ -216,20 +216,22 @@ class GsimLogicTree(object):
         """
         Make sure the IMTs are recognized by all GSIMs in the logic tree
         """
+        # parse the SA IMTs once, not for every coefficients table
+        sa_imts = [(imt, from_string(imt)) for imt in imts
+                   if imt.startswith('SA')]
         for trt in self.values:
             for gsim in self.values[trt]:
                 for attr in dir(gsim):
                     coeffs = getattr(gsim, attr)
                     if not isinstance(coeffs, CoeffsTable):
                         continue
-                    for imt in imts:
-                        if imt.startswith('SA'):
-                            try:
-                                coeffs[from_string(imt)]
-                            except KeyError:
-                                raise ValueError(
-                                    '%s is out of the period range defined '
-                                    'for %s' % (imt, gsim))
+                    for imt, sa in sa_imts:
+                        try:
+                            coeffs[sa]
+                        except KeyError:
+                            raise ValueError(
+                                '%s is out of the period range defined '
+                                'for %s' % (imt, gsim))
 
     def __toh5__(self):
         weights = set()
@@ -21,6 +21,7 @@ Module :mod:`openquake.hazardlib.imt` defines different intensity measure
 types.
 """
 import re
+import functools
 import collections
 import numpy
 
@@ -57,9 +58,11 @@ def imt2tup(string):
     return ('SA(%s)' % period, period)
 
 
+@functools.lru_cache()
 def from_string(imt, _damping=5.0):
     """
-    Convert an IMT string into an hazardlib object.
+    Convert an IMT string into an hazardlib object. The IMT objects are
+    immutable, so the result is cached.
 
     :param str imt:
         Intensity Measure Type.
@@ -24,7 +24,8 @@ from scipy.spatial import distance
 from shapely import geometry
 from openquake.baselib.general import not_equal, get_duplicates
 from openquake.hazardlib.geo.utils import (
-    fix_lon, cross_idl, _GeographicObjects, geohash, spherical_to_cartesian)
+    fix_lon, cross_idl, _GeographicObjects, geohash_array,
+    spherical_to_cartesian)
 from openquake.hazardlib.geo.mesh import Mesh
 
 U32LIMIT = 2 ** 32
@@ -546,9 +547,7 @@ class SiteCollection(object):
         :param length: length of the geohash in the range 1..8
         :returns: an array of N geohashes, one per site
         """
-        lst = [geohash(lon, lat, length)
-               for lon, lat in zip(self['lon'], self['lat'])]
-        return numpy.array(lst, (numpy.string_, length))
+        return geohash_array(self['lon'], self['lat'], length)
 
     def num_geohashes(self, length):
         """
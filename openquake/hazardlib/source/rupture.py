@@ -106,7 +106,7 @@ def to_csv_array(ruptures):
         rec['dep'] = rup.hypocenter.z
         rec['multiplicity'] = rup.multiplicity
         rec['trt'] = rup.tectonic_region_type
-        rec['kind'] = ' '.join(cls.__name__ for cls in code2cls[rup.code])
+        rec['kind'] = BaseRupture.code2str[rup.code]
         rec['mesh'] = json.dumps(
             [[[[float5(z) for z in y] for y in x] for x in array]
              for array in arrays])
@@ -263,6 +263,7 @@ class BaseRupture(metaclass=abc.ABCMeta):
         surface_classes = list(general.gen_subclasses(BaseSurface))
         code2cls = {}
         BaseRupture.str2code = {}
+        BaseRupture.code2str = {}
         for rup, sur in itertools.product(rupture_classes, surface_classes):
             chk = to_checksum8(rup, sur)
             if chk in code2cls and code2cls[chk] != (rup, sur):
@@ -270,7 +271,9 @@ class BaseRupture(metaclass=abc.ABCMeta):
                                  (chk, rup, sur))
             cls._code[rup, sur] = chk
             code2cls[chk] = rup, sur
-            BaseRupture.str2code['%s %s' % (rup.__name__, sur.__name__)] = chk
+            kind = '%s %s' % (rup.__name__, sur.__name__)
+            BaseRupture.str2code[kind] = chk
+            BaseRupture.code2str[chk] = kind
         return code2cls
 
     def __init__(self, mag, rake, tectonic_region_type, hypocenter,
@@ -652,9 +655,13 @@ def get_geom(surface, is_from_fault_source, is_multi_surface,
             #   - top right
             #   - bottom left
             #   - bottom right
-            lons = numpy.concatenate([x.corner_lons for x in surfaces])
-            lats = numpy.concatenate([x.corner_lats for x in surfaces])
-            depths = numpy.concatenate([x.corner_depths for x in surfaces])
+            # fill a single (3, 4*N) array instead of concatenating thrice
+            arr = numpy.empty((3, 4 * len(surfaces)))
+            for i, surf in enumerate(surfaces):
+                arr[0, 4 * i:4 * i + 4] = surf.corner_lons
+                arr[1, 4 * i:4 * i + 4] = surf.corner_lats
+                arr[2, 4 * i:4 * i + 4] = surf.corner_depths
+            lons, lats, depths = arr
         elif is_gridded_surface:
             # the surface mesh has shape (1, N)
             lons = surface.mesh.lons[0]
@@ -664,19 +671,14 @@ def get_geom(surface, is_from_fault_source, is_multi_surface,
             # For area or point source,
             # rupture geometry is represented by a planar surface,
             # defined by 3D corner points
-            lons = numpy.zeros((4))
-            lats = numpy.zeros((4))
-            depths = numpy.zeros((4))
-
             # NOTE: It is important to maintain the order of these
             # corner points. TODO: check the ordering
-            for i, corner in enumerate((surface.top_left,
-                                        surface.top_right,
-                                        surface.bottom_left,
-                                        surface.bottom_right)):
-                lons[i] = corner.longitude
-                lats[i] = corner.latitude
-                depths[i] = corner.depth
+            corners = (surface.top_left, surface.top_right,
+                       surface.bottom_left, surface.bottom_right)
+            lons, lats, depths = numpy.array(
+                [[c.longitude for c in corners],
+                 [c.latitude for c in corners],
+                 [c.depth for c in corners]], float)
     return lons, lats, depths
 
 
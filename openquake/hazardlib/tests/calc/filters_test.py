@@ -17,11 +17,13 @@
 # along with OpenQuake.  If not, see <http://www.gnu.org/licenses/>.
 import os
 import unittest
+import numpy
 from numpy.testing import assert_almost_equal as aae
 from openquake.baselib.general import gettemp
 from openquake.hazardlib import nrml
 from openquake.hazardlib.geo.point import Point
 from openquake.hazardlib.site import Site, SiteCollection
+from openquake.hazardlib.source.rupture import rupture_dt
 from openquake.hazardlib.calc.filters import (
     MagDepDistance, SourceFilter, angular_distance, split_source)
 
@@ -56,6 +58,22 @@ class SourceFilterTestCase(unittest.TestCase):
         sites = srcfilter.get_close_sites(src)
         self.assertIsNotNone(sites)
 
+    def test_count_close_sites(self):
+        rng = numpy.random.default_rng(42)
+        sitecol = SiteCollection.from_points(
+            rng.uniform(9, 11, 100), rng.uniform(44, 46, 100))
+        srcfilter = SourceFilter(sitecol, MagDepDistance.new('50'))
+        recs = numpy.zeros(50, rupture_dt)
+        recs['minlon'] = rng.uniform(8, 12, 50)
+        recs['maxlon'] = recs['minlon'] + .2
+        recs['minlat'] = rng.uniform(43, 47, 50)
+        recs['maxlat'] = recs['minlat'] + .2
+        recs['hypo'] = numpy.column_stack(
+            [recs['minlon'] + .1, recs['minlat'] + .1, numpy.full(50, 10.)])
+        expected = [len(srcfilter.close_sids(rec, 'TRT')) for rec in recs]
+        nsites = srcfilter.count_close_sites(recs, 'TRT')
+        numpy.testing.assert_equal(nsites, expected)
+
 
 # from https://groups.google.com/d/msg/openquake-users/P03SxJsfW_s/nCdcxj8WAAAJ
 characteric_source = '''\
@@ -27,10 +27,10 @@ from openquake.hazardlib.gsim.base import (
     GMPE, gsim_aliases, SitesContext, RuptureContext,
     NotVerifiedWarning, DeprecationWarning)
 from openquake.hazardlib.geo.point import Point
-from openquake.hazardlib.imt import PGA
+from openquake.hazardlib.imt import PGA, SA
 from openquake.hazardlib.site import Site, SiteCollection
 from openquake.hazardlib.source.rupture import BaseRupture
-from openquake.hazardlib.gsim.base import ContextMaker
+from openquake.hazardlib.gsim.base import ContextMaker, CoeffsTable
 from openquake.hazardlib.gsim.abrahamson_gulerce_2020 import (
     AbrahamsonGulerce2020SInter)
 aac = numpy.testing.assert_allclose
@@ -338,3 +338,21 @@ class AliasesTestCase(unittest.TestCase):
             valid.gsim(toml)
             n += 1
         print('Checked %d valid aliases' % n)
+
+
+class CoeffsTableTestCase(unittest.TestCase):
+    """
+    Check that ragged tables are parsed like in the past: extra cells
+    are ignored and missing cells default to 0
+    """
+    def test_ragged(self):
+        ct = CoeffsTable(sa_damping=5, table="""
+        imt   a    b    c
+        pga   1    2    3    4
+        0.1   5    6
+        1.0   7    8    9
+        """)
+        aac(ct.array['a'], [1, 5, 7])
+        aac(ct.array['c'], [3, 0, 9])
+        self.assertEqual(tuple(ct[PGA()]), (1., 2., 3.))
+        self.assertEqual(tuple(ct[SA(0.1)]), (5., 6., 0.))
@@ -20,12 +20,14 @@
 Implements the tests for the set of GMPE classes included within the
 GMPE of Bindi et al (2014)
 """
+import unittest
 from openquake.hazardlib.gsim.bindi_2014 import (BindiEtAl2014Rjb,
                                                  BindiEtAl2014RjbEC8,
                                                  BindiEtAl2014RjbEC8NoSOF,
                                                  BindiEtAl2014Rhyp,
                                                  BindiEtAl2014RhypEC8,
-                                                 BindiEtAl2014RhypEC8NoSOF)
+                                                 BindiEtAl2014RhypEC8NoSOF,
+                                                 _get_ln_coeffs)
 
 from openquake.hazardlib.tests.gsim.utils import BaseGSIMTestCase
 
@@ -122,3 +124,17 @@ class BindiEtAl2014RhypEC8NoSOFTestCase(BindiEtAl2014RjbTestCase):
     STD_FILE = "BINDI2014/B14_Rhypo_EC8_NoSOF_TOTAL_STD.csv"
     INTER_FILE = "BINDI2014/B14_Rhypo_EC8_NoSOF_INTER_STD.csv"
     INTRA_FILE = "BINDI2014/B14_Rhypo_EC8_NoSOF_INTRA_STD.csv"
+
+
+class BindiEtAl2014SharedCoeffsTestCase(unittest.TestCase):
+    """
+    The NoSOF variants must share the coefficient tables of their parents,
+    and therefore the natural logarithm tables cached by _get_ln_coeffs
+    """
+    def test_shared_coeffs(self):
+        self.assertIs(BindiEtAl2014RjbEC8NoSOF.COEFFS,
+                      BindiEtAl2014RjbEC8.COEFFS)
+        self.assertIs(BindiEtAl2014RhypEC8NoSOF.COEFFS,
+                      BindiEtAl2014RhypEC8.COEFFS)
+        self.assertIs(_get_ln_coeffs(BindiEtAl2014RhypEC8NoSOF.COEFFS),
+                      _get_ln_coeffs(BindiEtAl2014RhypEC8.COEFFS))
@@ -203,9 +203,16 @@ class BaseGSIMTestCase(unittest.TestCase):
                 out_types.append(sdt.upper().replace(' ', '_') + '_STDDEV')
 
         cmaker, df = read_cmaker_df(gsim, fnames)
-        for ctx in gen_ctxs(df):
+        ctxs = list(gen_ctxs(df))
+        for ctx in ctxs:
             ctx.occurrence_rate = 0
-            out = cmaker.get_mean_stds([ctx])[:, 0]
+        # compute means and stddevs for all the contexts in a single call
+        outs = cmaker.get_mean_stds(ctxs)[:, 0]  # shape (4, M, N)
+        start = 0
+        for ctx in ctxs:
+            slc = slice(start, start + len(ctx.sids))
+            start = slc.stop
+            out = outs[:, :, slc]
             for o, out_type in enumerate(out_types):
                 if not hasattr(ctx, out_type):
                     # for instance MEAN is missing in zhao_2016_test
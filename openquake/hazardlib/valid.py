@@ -1091,6 +1091,7 @@ class Param(object):
     :param validator: the validator
     :param default: the default value
     """
+    __slots__ = ('validator', 'default', 'name')
     NODEFAULT = object()
 
     def __init__(self, validator, default=NODEFAULT, name=None):
@@ -1118,12 +1119,21 @@ class Param(object):
 class MetaParamSet(type):
     """
     Set the `.name` attribute of every Param instance defined inside
-    any subclass of ParamSet.
+    any subclass of ParamSet and build the table `cls.params` of the
+    Param instances, including the inherited ones, so that they can be
+    looked up by name without walking the class hierarchy.
     """
     def __init__(cls, name, bases, dic):
         for name, val in dic.items():
             if isinstance(val, Param):
                 val.name = name
+        cls.params = {}
+        for klass in reversed(cls.__mro__):
+            for name, val in vars(klass).items():
+                if isinstance(val, Param):
+                    cls.params[name] = val
+                elif name in cls.params:  # overridden by a non-Param
+                    del cls.params[name]
 
 
 # used in commonlib.oqvalidation
@@ -1182,8 +1192,8 @@ class ParamSet(metaclass=MetaParamSet):
         out = {}
         for name, text in dic.items():
             try:
-                p = getattr(cls, name)
-            except AttributeError:
+                p = cls.params[name]
+            except KeyError:
                 logging.warning('Ignored unknown parameter %s', name)
             else:
                 out[name] = p.validator(text)
@@ -1196,8 +1206,7 @@ class ParamSet(metaclass=MetaParamSet):
         which are assumed to be already valid.
         """
         self = cls.__new__(cls)
-        for k, v in dic.items():
-            setattr(self, k, ast.literal_eval(v))
+        vars(self).update((k, ast.literal_eval(v)) for k, v in dic.items())
         return self
 
     def to_params(self):
@@ -1216,8 +1225,8 @@ class ParamSet(metaclass=MetaParamSet):
                 raise NameError('The parameter name %s is not acceptable'
                                 % name)
             try:
-                convert = getattr(self.__class__, name).validator
-            except AttributeError:
+                convert = self.params[name].validator
+            except KeyError:
                 if name not in self.KNOWN_INPUTS:
                     logging.warning(
                         "The parameter '%s' is unknown, ignoring" % name)
@@ -16,13 +16,14 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with OpenQuake. If not, see <http://www.gnu.org/licenses/>.
 import operator
+import functools
 import itertools
 import logging
 import csv
 import os
 import numpy
 import pandas
-from shapely import wkt, geometry
+from shapely import wkt, geometry, prepared
 
 from openquake.baselib import hdf5, general
 from openquake.baselib.node import Node, context
@@ -442,10 +443,14 @@ class AssetCollection(object):
         """
         :returns: numpy array of lists with the assets by each site
         """
-        assets_by_site = [[] for sid in range(self.tot_sites)]
-        for i, ass in enumerate(self.array):
-            assets_by_site[ass['site_id']].append(self[i])
-        return numpy.array(assets_by_site)
+        # sort the site IDs once in numpy, keeping the asset order per site
+        sids = self.array['site_id']
+        order = numpy.argsort(sids, kind='stable')
+        counts = numpy.bincount(sids, minlength=self.tot_sites)
+        assets_by_site = numpy.empty(self.tot_sites, object)
+        for sid, idxs in enumerate(numpy.split(order, counts.cumsum()[:-1])):
+            assets_by_site[sid] = self.array[idxs]
+        return assets_by_site
 
     # used in the extract API
     def aggregateby(self, tagnames, array):
@@ -523,10 +528,12 @@ class AssetCollection(object):
                 df.index = self['ordinal'] + 1
             elif tagnames == ['site_id']:
                 df.index = self['site_id'] + 1
-            for key, grp in df.groupby(df.index):
+            # aggregate all the groups at once instead of one at the time
+            sums = df.groupby(df.index).sum()
+            for key, row in zip(sums.index.tolist(), sums.to_numpy()):
                 if isinstance(key, int):
                     key = key,  # turn it into a 1-value tuple
-                agg_values[aggkey[key]] = tuple(grp.sum())
+                agg_values[aggkey[key]] = tuple(row)
         if self.fields:  # missing in scenario_damage case_8
             agg_values[K] = tuple(df.sum())
         return agg_values
@@ -646,38 +653,41 @@ def build_asset_array(assets_by_site, tagnames=(), time_event=None):
              (str(name), float) for name in float_fields] + int_fields)
     num_assets = sum(len(assets) for assets in assets_by_site)
     assetcol = numpy.zeros(num_assets, asset_dt)
+    # build the accessor of each field once, not for each asset
+    getters = {}
+    for field in asset_dt.names:
+        if field == 'site_id':  # set below
+            continue
+        elif field == 'id':
+            getters[field] = operator.attrgetter('asset_id')
+        elif field == 'ordinal':
+            getters[field] = operator.attrgetter('ordinal')
+        elif field == 'value-number':
+            getters[field] = operator.attrgetter('number')
+        elif field == 'area':
+            getters[field] = operator.attrgetter('area')
+        elif field == 'lon':
+            getters[field] = lambda asset: asset.location[0]
+        elif field == 'lat':
+            getters[field] = lambda asset: asset.location[1]
+        elif field.startswith('occupants_'):
+            getters[field] = lambda asset, f=field: asset.values[f]
+        elif field == 'retrofitted':
+            getters[field] = operator.methodcaller('retrofitted')
+        elif field in tagnames:
+            getters[field] = lambda asset, i=tagi[field]: asset.tagidxs[i]
+        else:
+            name, lt = field.split('-')
+            getters[field] = operator.methodcaller('value', lt, time_event)
     asset_ordinal = 0
-    fields = set(asset_dt.fields)
     for sid, assets_ in enumerate(assets_by_site):
         for asset in assets_:
             asset.ordinal = asset_ordinal
             record = assetcol[asset_ordinal]
             asset_ordinal += 1
-            for field in fields:
-                if field == 'id':
-                    value = asset.asset_id
-                elif field == 'ordinal':
-                    value = asset.ordinal
-                elif field == 'value-number':
-                    value = asset.number
-                elif field == 'area':
-                    value = asset.area
-                elif field == 'site_id':
-                    value = sid
-                elif field == 'lon':
-                    value = asset.location[0]
-                elif field == 'lat':
-                    value = asset.location[1]
-                elif field.startswith('occupants_'):
-                    value = asset.values[field]
-                elif field == 'retrofitted':
-                    value = asset.retrofitted()
-                elif field in tagnames:
-                    value = asset.tagidxs[tagi[field]]
-                else:
-                    name, lt = field.split('-')
-                    value = asset.value(lt, time_event)
-                record[field] = value
+            record['site_id'] = sid
+            for field, get in getters.items():
+                record[field] = get(asset)
     return assetcol, ' '.join(occupancy_periods)
 
 
@@ -838,6 +848,15 @@ def assets2array(asset_nodes, fields, retrofitted, ignore_missing_costs):
     return array
 
 
+@functools.lru_cache()
+def _get_value_fields(names):
+    # the fields are the same for all the assets in an exposure file,
+    # so the split between costs and occupancies is computed only once
+    costfields = [name for name in names if name.startswith('value-')]
+    occfields = [name for name in names if name.startswith('occupants_')]
+    return costfields, occfields
+
+
 class Exposure(object):
     """
     A class to read the exposure from XML/CSV files
@@ -1021,6 +1040,10 @@ class Exposure(object):
             yield from array
 
     def _populate_from(self, asset_array, param, check_dupl):
+        if param['region']:
+            # prepare the region once, it is checked for each asset;
+            # removed at the end since prepared geometries cannot be pickled
+            param['prepared_region'] = prepared.prep(param['region'])
         asset_refs = set()
         for idx, asset in enumerate(asset_array):
             asset_id = asset['id']
@@ -1031,6 +1054,7 @@ class Exposure(object):
                     asset_id, param['fname']))
             asset_refs.add(param['asset_prefix'] + asset_id)
             self._add_asset(idx, asset, param)
+        param.pop('prepared_region', None)
 
     def _add_asset(self, idx, asset, param):
         values = {}
@@ -1045,8 +1069,8 @@ class Exposure(object):
         taxonomy = asset['taxonomy']
         number = asset['number']
         location = asset['lon'], asset['lat']
-        if param['region'] and not geometry.Point(*location).within(
-                param['region']):
+        if param['region'] and not param['prepared_region'].contains(
+                geometry.Point(*location)):
             param['out_of_region'] += 1
             return
         dic = {tagname: asset[tagname] for tagname in self.tagcol.tagnames
@@ -1055,17 +1079,15 @@ class Exposure(object):
         dic['taxonomy'] = taxonomy
         idxs = self.tagcol.add_tags(dic, prefix)
         tot_occupants = 0
-        num_occupancies = 0
-        for name in asset.dtype.names:
-            if name.startswith('value-'):
-                values[name[6:]] = asset[name]
-            elif name.startswith('occupants_'):
-                values[name] = occ = float(asset[name])
-                tot_occupants += occ
-                num_occupancies += 1
-        if num_occupancies:
+        costfields, occfields = _get_value_fields(asset.dtype.names)
+        for name in costfields:
+            values[name[6:]] = asset[name]
+        for name in occfields:
+            values[name] = occ = float(asset[name])
+            tot_occupants += occ
+        if occfields:
             # store average occupants
-            values['occupants'] = tot_occupants / num_occupancies
+            values['occupants'] = tot_occupants / len(occfields)
 
         # check if we are not missing a cost type
         missing = param['relevant_cost_types'] - set(values)
@@ -1092,10 +1114,17 @@ class Exposure(object):
         """
         :returns: (Mesh instance, assets_by_site list)
         """
-        assets_by_loc = general.groupby(self, key=lambda a: a.location)
-        mesh = geo.Mesh.from_coords(list(assets_by_loc))
-        assets_by_site = [
-            assets_by_loc[lonlat] for lonlat in zip(mesh.lons, mesh.lats)]
+        # fill the coordinates buffer directly, without a list of tuples
+        lonlats = itertools.chain.from_iterable(
+            asset.location for asset in self.assets)
+        coords = numpy.fromiter(
+            lonlats, float, 2 * len(self.assets)).reshape(-1, 2)
+        # the unique locations are returned in lexicographic order
+        lonlats, inv = numpy.unique(coords, axis=0, return_inverse=True)
+        mesh = geo.Mesh(lonlats[:, 0], lonlats[:, 1])
+        assets_by_site = [[] for _ in range(len(lonlats))]
+        for asset, idx in zip(self.assets, inv):
+            assets_by_site[idx].append(asset)
         return mesh, assets_by_site
 
     def __iter__(self):
@@ -1371,14 +1371,16 @@ class InsuredLosses(object):
         o = out[lt]
         o['ins_loss'] = numpy.zeros(len(o))
         if lt in self.policy_dict and len(o):
-            policy = self.policy_dict[lt]
-            for (eid, aid), df in o.iterrows():
-                asset = asset_df.loc[aid]
-                avalue = asset['value-' + lt]
-                policy_idx = asset[self.policy_name]
-                ded, lim = policy[policy_idx]
-                ins = insured_losses(df.loss, ded * avalue, lim * avalue)
-                o.loc[eid, aid]['ins_loss'] = ins
+            # look up the deductibles and limits of all rows at once,
+            # instead of one asset lookup per (event, asset) pair
+            assets = asset_df.loc[o.index.get_level_values(1)]
+            avalue = assets['value-' + lt].to_numpy()
+            ded, lim = self.policy_dict[lt][
+                assets[self.policy_name].to_numpy()].T
+            ded = ded * avalue
+            # same as insured_losses, but with a deductible per row
+            o['ins_loss'] = numpy.clip(o.loss.to_numpy(), ded,
+                                       lim * avalue) - ded
 
 
 # not used anymore
@@ -16,6 +16,7 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with OpenQuake.  If not, see <http://www.gnu.org/licenses/>.
 import os
+import json
 import psutil
 import getpass
 import operator
@@ -39,6 +40,25 @@ ELSE 'hazard'
 END AS job_type
 '''
 
+# valid job statuses and the ones for which is_running is 0
+JOB_STATUSES = frozenset(['created', 'submitted', 'executing', 'complete',
+                          'aborted', 'failed', 'deleted'])
+NOT_RUNNING = frozenset(['created', 'complete', 'failed', 'aborted',
+                         'deleted'])
+
+
+def _ids_filter(ids):
+    """
+    :param ids: a list of job IDs
+    :returns: a pair (SQL condition, query argument) selecting those IDs
+    """
+    if len(ids) > 256:
+        # pass the IDs as a single JSON payload rather than one bound
+        # parameter per ID, since SQLite limits the number of parameters
+        return ('id IN (SELECT value FROM json_each(?x))',
+                json.dumps([int(i) for i in ids]))
+    return 'id IN (?X)', ids
+
 
 def check_outdated(db):
     """
@@ -70,12 +90,10 @@ def set_status(db, job_id, status):
     :param job_id: ID of the current job
     :param status: status string
     """
-    assert status in (
-        'created', 'submitted', 'executing', 'complete', 'aborted', 'failed',
-        'deleted'), status
-    if status in ('created', 'complete', 'failed', 'aborted', 'deleted'):
+    assert status in JOB_STATUSES, status
+    if status in NOT_RUNNING:
         is_running = 0
-    else:  # 'executing'
+    else:  # 'submitted', 'executing'
         is_running = 1
     if job_id < 0:
         rows = db('SELECT id FROM job ORDER BY id DESC LIMIT ?x', -job_id)
@@ -118,6 +136,28 @@ def create_job(db, datadir, calculation_mode='to be set',
               job.keys(), job.values()).lastrowid
 
 
+def create_jobs(db, datadir, modes_descrs, user_name=None, hc_id=None):
+    """
+    Create several jobs with a single insert, return their IDs.
+
+    :param db: a :class:`openquake.server.dbapi.Db` instance
+    :param datadir: data directory of the user running the jobs
+    :param modes_descrs: a list of pairs (calculation_mode, description)
+    :param user_name: name of the user running the jobs
+    :param hc_id: ID of the parent job (if any)
+    :returns: the job IDs
+    """
+    start = get_calc_id(db, datadir) + 1
+    user_name = user_name or getpass.getuser()
+    fields = ('id is_running description user_name calculation_mode '
+              'hazard_calculation_id ds_calc_dir').split()
+    rows = [(calc_id, 1, descr, user_name, mode, hc_id,
+             os.path.join('%s/calc_%s' % (datadir, calc_id)))
+            for calc_id, (mode, descr) in enumerate(modes_descrs, start)]
+    db.insert('job', fields, rows)
+    return [row[0] for row in rows]
+
+
 def import_job(db, calc_id, calc_mode, description, user_name, status,
                hc_id, datadir):
     """
@@ -131,7 +171,8 @@ def import_job(db, calc_id, calc_mode, description, user_name, status,
                is_running=0,
                status=status,
                ds_calc_dir=os.path.join('%s/calc_%s' % (datadir, calc_id)))
-    db('INSERT INTO job (?S) VALUES (?X)', job.keys(), job.values())
+    # the job is not inserted if there is already one with the same ID
+    db('INSERT OR IGNORE INTO job (?S) VALUES (?X)', job.keys(), job.values())
 
 
 def delete_uncompleted_calculations(db, user):
@@ -237,12 +278,13 @@ def list_outputs(db, job_id, full=True):
     :param bool full:
         If True produce a full listing, otherwise a short version
     """
-    outputs = get_outputs(db, job_id)
+    # let the database sort the outputs
+    outs = db('SELECT id, display_name FROM output WHERE oq_job_id=?x '
+              'ORDER BY display_name, id', job_id)
     out = []
-    if len(outputs) > 0:
+    if len(outs) > 0:
         truncated = False
         out.append('  id | name')
-        outs = sorted(outputs, key=operator.attrgetter('display_name'))
         for i, o in enumerate(outs):
             if not full and i >= 10:
                 out.append(' ... | %d additional output(s)' % (len(outs) - 10))
@@ -264,8 +306,29 @@ def get_outputs(db, job_id):
         ID of a calculation.
     :returns:
         A sequence of :class:`openquake.server.db.models.Output` objects
+        with the fields id, display_name, ds_key and size_mb
+    """
+    return db('SELECT id, display_name, ds_key, size_mb FROM output '
+              'WHERE oq_job_id=?x', job_id)
+
+
+def get_user_outputs(db, job_id):
+    """
+    :param db:
+        a :class:`openquake.server.dbapi.Db` instance
+    :param job_id:
+        ID of a calculation.
+    :returns:
+        the owner of the calculation and its outputs, with the fields
+        id, display_name, ds_key and size_mb, read with a single query
     """
-    return db('SELECT * FROM output WHERE oq_job_id=?x', job_id)
+    rows = db('SELECT job.user_name, output.id, output.display_name, '
+              'output.ds_key, output.size_mb '
+              'FROM job LEFT JOIN output ON output.oq_job_id=job.id '
+              'WHERE job.id=?x ORDER BY output.id', job_id)
+    if not rows:
+        raise NotFound
+    return rows[0].user_name, [row for row in rows if row.id is not None]
 
 
 DISPLAY_NAME = {
@@ -354,11 +417,24 @@ def del_calc(db, job_id, user, force=False):
         "AND status != 'deleted'", job_id)
     job_ids = [dep.id for dep in dependent]
     if not force and job_id in job_ids:  # jobarray
-        err = []
-        for jid in job_ids:
-            res = del_calc(db, jid, user, force=True)
-            if "error" in res:
-                err.append(res["error"])
+        # read and update the whole array with a single query each,
+        # instead of calling del_calc once per job
+        cond, arg = _ids_filter(job_ids)
+        jobs = db('SELECT id, user_name, ds_calc_dir FROM job WHERE ' + cond,
+                  arg)
+        owned = [job for job in jobs if job.user_name == user]
+        err = ['Cannot delete calculation %d: it belongs to '
+               '%s and you are %s' % (job.id, job.user_name, user)
+               for job in jobs if job.user_name != user]
+        if owned:
+            cond, arg = _ids_filter([job.id for job in owned])
+            db("UPDATE job SET status='deleted' WHERE " + cond, arg)
+        for job in owned:
+            fname = job.ds_calc_dir + ".hdf5"
+            try:
+                os.remove(fname)
+            except OSError as exc:  # permission error
+                err.append('Could not remove %s: %s' % (fname, exc))
         if err:
             return {"error": ' '.join(err)}
         else:
@@ -416,11 +492,12 @@ def get_log(db, job_id):
     :param db: a :class:`openquake.server.dbapi.Db` instance
     :param job_id: a job ID
     """
-    logs = db('SELECT * FROM log WHERE job_id=?x ORDER BY id', job_id)
+    logs = db('SELECT timestamp, level, message FROM log '
+              'WHERE job_id=?x ORDER BY id', job_id, iterate=True)
     out = []
-    for log in logs:
-        time = str(log.timestamp)[:-4]  # strip decimals
-        out.append('[%s #%d %s] %s' % (time, job_id, log.level, log.message))
+    for timestamp, level, message in logs:
+        time = str(timestamp)[:-4]  # strip decimals
+        out.append('[%s #%d %s] %s' % (time, job_id, level, message))
     return out
 
 
@@ -500,7 +577,8 @@ def calc_info(db, calc_id):
     :param calc_id: calculation ID
     :returns: dictionary of info about the given calculation
     """
-    job = db('SELECT * FROM job WHERE id=?x', calc_id, one=True)
+    job = db('SELECT user_name, status, start_time, stop_time, is_running '
+             'FROM job WHERE id=?x', calc_id, one=True)
     response_data = {}
     response_data['user_name'] = job.user_name
     response_data['status'] = job.status
@@ -545,20 +623,25 @@ def get_calcs(db, request_get_dict, allowed_users, user_acl_on=False, id=None):
     else:
         limit = 100
 
-    if 'start_time' in request_get_dict:
-        # assume an ISO date string
-        time_filter = "start_time >= '%s'" % request_get_dict.get('start_time')
-    else:
-        time_filter = 1
-
+    # the values are passed as query parameters, never interpolated
+    args = [filterdict]
     if user_acl_on:
         users_filter = "user_name IN (?X)"
+        args.append(allowed_users)
     else:
         users_filter = 1
 
+    if 'start_time' in request_get_dict:
+        # assume an ISO date string
+        time_filter = "start_time >= ?x"
+        args.append(request_get_dict.get('start_time'))
+    else:
+        time_filter = 1
+    args.append(limit)
+
     jobs = db('SELECT * FROM job WHERE ?A AND %s AND %s '
-              "AND status != 'deleted' ORDER BY id DESC LIMIT %d"
-              % (users_filter, time_filter, limit), filterdict, allowed_users)
+              "AND status != 'deleted' ORDER BY id DESC LIMIT ?x"
+              % (users_filter, time_filter), *args)
     return [(job.id, job.user_name, job.status, job.calculation_mode,
              job.is_running, job.description, job.pid,
              job.hazard_calculation_id, job.size_mb) for job in jobs]
@@ -578,6 +661,21 @@ def update_job(db, job_id, dic):
     db('UPDATE job SET ?D WHERE id=?x', dic, job_id)
 
 
+def update_jobs(db, job_ids, dic):
+    """
+    Update several calculation records at once, with a single query.
+
+    :param db:
+        a :class:`openquake.server.dbapi.Db` instance
+    :param job_ids:
+        a list of job IDs
+    :param dic:
+        a dictionary of valid field/values for the job table
+    """
+    cond, arg = _ids_filter(job_ids)
+    db('UPDATE job SET ?D WHERE ' + cond, dic, arg)
+
+
 def update_parent_child(db, parent_child):
     """
     Set hazard_calculation_id (parent) on a job_id (child)
@@ -665,10 +763,14 @@ def get_results(db, job_id):
         a job ID
     :returns: (datadir, datastore_keys)
     """
-    ds_calc_dir = db('SELECT ds_calc_dir FROM job WHERE id=?x', job_id,
-                     scalar=True)
-    datadir = os.path.dirname(ds_calc_dir)
-    return datadir, [output.ds_key for output in get_outputs(db, job_id)]
+    # a single query for the job and its outputs (if any)
+    rows = db('SELECT ds_calc_dir, ds_key FROM job LEFT JOIN output '
+              'ON output.oq_job_id=job.id WHERE job.id=?x '
+              'ORDER BY output.id', job_id)
+    if not rows:
+        raise NotFound
+    datadir = os.path.dirname(rows[0].ds_calc_dir)
+    return datadir, [row.ds_key for row in rows if row.ds_key is not None]
 
 
 # ############################### db commands ########################### #
@@ -0,0 +1,3 @@
+CREATE INDEX job_user_name on job (user_name);
+
+CREATE INDEX job_hazard_calculation_id on job (hazard_calculation_id);
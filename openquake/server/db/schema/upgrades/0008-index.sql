@@ -0,0 +1 @@
+CREATE INDEX job_status on job (status);
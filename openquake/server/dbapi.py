@@ -185,9 +185,16 @@ Traceback (most recent call last):
    ...
 NotFound
 
+For big queries it is possible to pass `iterate=True`: then the rows
+are not fetched all at once, and a cursor yielding plain tuples is returned:
+
+>>> list(db('SELECT value FROM job ORDER BY id', iterate=True))
+[(42,), (43,), (44,)]
+
 """
 import re
 import threading
+import functools
 import collections
 
 
@@ -256,6 +263,25 @@ class _Replacer(object):
         return templ.format(*self.sargs), tuple(self.xargs)
 
 
+@functools.lru_cache(maxsize=256)
+def _strip_comments(m_templ):
+    # strip commented lines; the same literal templates are used
+    # over and over (e.g. at each log record), so the result is cached
+    return '\n'.join(line for line in m_templ.splitlines()
+                     if not line.lstrip().startswith('--'))
+
+
+@functools.lru_cache(maxsize=256)
+def _precompile(m_templ):
+    # templates with only ?x placeholders translate to the same SQL
+    # whatever the arguments, so they are translated once; returns
+    # the SQL and the number of placeholders, or (None, 0)
+    placeholders = _Replacer.rx.findall(m_templ)
+    if any(ph != '?x' for ph in placeholders):
+        return None, 0
+    return m_templ.replace('?x', _Replacer.ph), len(placeholders)
+
+
 def match(m_templ, *m_args):
     """
     :param m_templ: a meta template string
@@ -267,11 +293,12 @@ def match(m_templ, *m_args):
     >>> match('SELECT * FROM job WHERE id=?x', 1)
     ('SELECT * FROM job WHERE id=?', (1,))
     """
-    # strip commented lines
-    m_templ = '\n'.join(line for line in m_templ.splitlines()
-                        if not line.lstrip().startswith('--'))
+    m_templ = _strip_comments(m_templ)
     if not m_args:
         return m_templ, ()
+    templ, n = _precompile(m_templ)
+    if templ is not None and n == len(m_args):
+        return templ, m_args
     try:
         return _Replacer(m_args).match(m_templ)
     except IndexError:
@@ -334,6 +361,8 @@ class Db(object):
         except Exception as exc:
             raise exc.__class__('%s: %s %s' % (exc, templ, args))
         if templ.lstrip().lower().startswith(('select', 'pragma')):
+            if kw.get('iterate'):  # stream the rows, do not fetch them
+                return cursor
             rows = cursor.fetchall()
             if kw.get('scalar'):  # scalar query
                 if not rows:
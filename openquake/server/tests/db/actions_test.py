@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# vim: tabstop=4 shiftwidth=4 softtabstop=4
+#
+# Copyright (C) 2021 GEM Foundation
+#
+# OpenQuake is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Affero General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# OpenQuake is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with OpenQuake. If not, see <http://www.gnu.org/licenses/>.
+
+import sqlite3
+import unittest
+from openquake.server.dbapi import Db, NotFound
+from openquake.server.db import actions
+
+
+class GetUserOutputsTestCase(unittest.TestCase):
+    # run the action on an in-memory database with the real schema
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = Db(sqlite3.connect, ':memory:', isolation_level=None,
+                    detect_types=sqlite3.PARSE_DECLTYPES)
+        actions.upgrade_db(cls.db)
+        for job_id, user in [(1, 'user1'), (2, 'user2')]:
+            cls.db('INSERT INTO job (?S) VALUES (?X)',
+                   ['id', 'user_name', 'calculation_mode', 'description',
+                    'ds_calc_dir'],
+                   [job_id, user, 'classical', 'test',
+                    '/tmp/calc_%d' % job_id])
+        actions.create_outputs(cls.db, 1, [('hcurves', 1.5),
+                                           ('events', 0.1)], 2.0)
+
+    def test_with_outputs(self):
+        user_name, outputs = actions.get_user_outputs(self.db, 1)
+        self.assertEqual(user_name, 'user1')
+        self.assertEqual([(out.display_name, out.ds_key, out.size_mb)
+                          for out in outputs],
+                         [('Hazard Curves', 'hcurves', 1.5),
+                          ('Events', 'events', 0.1)])
+
+    def test_without_outputs(self):
+        self.assertEqual(actions.get_user_outputs(self.db, 2), ('user2', []))
+
+    def test_missing_job(self):
+        with self.assertRaises(NotFound):
+            actions.get_user_outputs(self.db, 3)
@@ -29,6 +29,8 @@ from openquake.server.db.upgrade_manager import (
     VersionTooSmall, DuplicatedVersion)
 
 pkg = 'openquake.server.tests.db.upgrades'
+# set OQ_TEST_INMEM=1 to run the tests on in-memory databases
+INMEM = os.environ.get('OQ_TEST_INMEM') == '1'
 upgrader = importlib.import_module(pkg).upgrader
 
 
@@ -63,13 +65,18 @@ class UpgradeManagerTestCase(unittest.TestCase):
 
     def setUp(self):
         global conn, tmpfile
+        if INMEM:  # no need to touch the filesystem
+            tmpfile = None
+            conn = sqlite3.connect(':memory:')
+            return
         fd, tmpfile = tempfile.mkstemp()
         os.close(fd)
         conn = sqlite3.connect(tmpfile)
 
     def tearDown(self):
         conn.close()
-        os.remove(tmpfile)
+        if tmpfile:
+            os.remove(tmpfile)
 
     def test_missing_pkg(self):
         with self.assertRaises(SystemExit) as ctx:
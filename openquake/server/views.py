@@ -18,6 +18,7 @@
 
 import shutil
 import json
+import functools
 import string
 import pickle
 import logging
@@ -108,6 +109,22 @@ def cross_domain_ajax(func):
     return wrap
 
 
+@functools.lru_cache()
+def _get_output_types():
+    """
+    :returns: a map output_type -> extensions, without the .txt outputs
+
+    The exporters are registered once and for all, so the map is
+    computed only at the first request.
+    """
+    # NB: export_output has as keys the list (output_type, extension)
+    # so this returns an ordered map output_type -> extensions such as
+    # {'agg_loss_curve': ['xml', 'csv'], ...}
+    # Catalina asked to remove the .txt outputs (used for the GMFs)
+    return groupby(export, lambda oe: oe[0],
+                   lambda oes: [e for o, e in oes if e != 'txt'])
+
+
 def _get_base_url(request):
     """
     Construct a base URL, given a request object.
@@ -225,10 +242,8 @@ def get_ini_defaults(request):
     Return a list of ini attributes with a default value
     """
     ini_defs = {}
-    for name in dir(oqvalidation.OqParam):
-        obj = getattr(oqvalidation.OqParam, name)
-        if (isinstance(obj, valid.Param)
-                and obj.default is not valid.Param.NODEFAULT):
+    for name, obj in oqvalidation.OqParam.params.items():
+        if obj.default is not valid.Param.NODEFAULT:
             ini_defs[name] = obj.default
     return HttpResponse(content=json.dumps(ini_defs), content_type=JSON)
 
@@ -628,19 +643,13 @@ def calc_results(request, calc_id):
     # If the specified calculation doesn't exist OR is not yet complete,
     # throw back a 404.
     try:
-        info = logs.dbcmd('calc_info', calc_id)
-        if not utils.user_has_permission(request, info['user_name']):
+        user_name, results = logs.dbcmd('get_user_outputs', calc_id)
+        if not utils.user_has_permission(request, user_name):
             return HttpResponseForbidden()
     except dbapi.NotFound:
         return HttpResponseNotFound()
     base_url = _get_base_url(request)
-
-    # NB: export_output has as keys the list (output_type, extension)
-    # so this returns an ordered map output_type -> extensions such as
-    # {'agg_loss_curve': ['xml', 'csv'], ...}
-    output_types = groupby(export, lambda oe: oe[0],
-                           lambda oes: [e for o, e in oes])
-    results = logs.dbcmd('get_outputs', calc_id)
+    output_types = _get_output_types()
     if not results:
         return HttpResponseNotFound()
 
@@ -648,8 +657,7 @@ def calc_results(request, calc_id):
     for result in results:
         try:  # output from the datastore
             rtype = result.ds_key
-            # Catalina asked to remove the .txt outputs (used for the GMFs)
-            outtypes = [ot for ot in output_types[rtype] if ot != 'txt']
+            outtypes = output_types[rtype]
         except KeyError:
             continue  # non-exportable outputs should not be shown
         url = urlparse.urljoin(base_url, 'v1/calc/result/%d' % result.id)